@@ -7,41 +7,61 @@ import time
 import math
 from datetime import datetime
 
+TWO_PI = 2 * math.pi
+
+def _advance(phase, step, sin=math.sin):
+    """Pure breath step: advance phase by step radians and return (phase, depth)"""
+    phase = (phase + step) % TWO_PI
+    return phase, 0.5 * (sin(phase) + 1.0)
+
 class BreathEngine:
     def __init__(self):
         self.breath_depth = 0.0  # 0.0 to 1.0
         self.breath_phase = 0.0  # 0.0 to 2π
         self.breath_rate = 1.0   # breaths per second
-        self.last_breath_time = time.time()
+        self.last_breath_time_ns = time.monotonic_ns()
         self.breath_cycle_count = 0
         self.breath_intensity = 1.0
         
     def breathe(self):
         """Execute one breath cycle"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_breath_time
-        
-        # Calculate breath phase
-        self.breath_phase += time_since_last * self.breath_rate * 2 * math.pi
-        self.breath_phase %= 2 * math.pi
-        
-        # Calculate breath depth using sine wave
-        self.breath_depth = (math.sin(self.breath_phase) + 1) / 2
-        
-        # Update cycle count
-        if self.breath_phase < time_since_last * self.breath_rate * 2 * math.pi:
+        now_ns = time.monotonic_ns()
+        step = (now_ns - self.last_breath_time_ns) * 1e-9 * self.breath_rate * TWO_PI
+        self.breath_phase, self.breath_depth = _advance(self.breath_phase, step)
+        # A wrap past 2π completes a breath cycle
+        if self.breath_phase < step:
             self.breath_cycle_count += 1
-            
-        self.last_breath_time = current_time
+        self.last_breath_time_ns = now_ns
         
         return {
             'depth': self.breath_depth,
             'phase': self.breath_phase,
             'cycle_count': self.breath_cycle_count,
             'intensity': self.breath_intensity,
-            'timestamp': current_time
+            'timestamp': time.time()  # Wall clock; the monotonic stamp is only for dt
         }
     
+    def breathe_batch(self, n, dt):
+        """Advance n breaths of dt seconds each and return the sampled schedule"""
+        step = dt * self.breath_rate * TWO_PI
+        phase = self.breath_phase
+        phases = []
+        depths = []
+        
+        for _ in range(n):
+            phase, depth = _advance(phase, step)
+            # A wrap past 2π completes a breath cycle
+            if phase < step:
+                self.breath_cycle_count += 1
+            phases.append(phase)
+            depths.append(depth)
+        
+        if n > 0:
+            self.breath_phase = phase
+            self.breath_depth = depths[-1]
+        
+        return {'depths': depths, 'phases': phases}
+    
     def get_breath_state(self):
         """Get current breath state without advancing"""
         return {
@@ -67,6 +87,10 @@ class BreathEngine:
         """Check if currently in exhale phase"""
         return self.breath_phase >= math.pi
     
+    def classify_phases(self, phases):
+        """Classify a batch of phases (e.g. from breathe_batch) as a bytes mask: 1 = inhale, 0 = exhale"""
+        return bytes(phase < math.pi for phase in phases)
+    
     def get_breath_pulse(self):
         """Get a pulse value based on current breath state"""
         return self.breath_depth * self.breath_intensity
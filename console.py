@@ -0,0 +1,85 @@
+"""
+Console telemetry for Explorer
+Color-coded, buffered output and trait translations shared by all modules
+"""
+
+import os
+import sys
+import atexit
+
+# ANSI color codes for Windows terminal
+
+class Colors:
+    RED = '\033[91m'
+    GREEN = '\033[92m'
+    BLUE = '\033[94m'
+    CYAN = '\033[96m'
+    YELLOW = '\033[93m'
+    GRAY = '\033[90m'
+    ORANGE = '\033[38;5;214m'  # Orange/Gold for math
+    END = '\033[0m'
+
+# Per-color format strings, built once so each line is a single % format
+_COLOR_FMT = {
+    color: color + '%s' + Colors.END
+    for name, color in vars(Colors).items() if not name.startswith('_') and name != 'END'
+}
+_MATH_FMT = _COLOR_FMT[Colors.ORANGE]
+
+TRAIT_TRANSLATIONS = {
+    'speed_ms': ('Speed (ms)', 'How fast did it run?'),
+    'memory_mb': ('Memory (MB)', 'How much computer memory did it use?'),
+    'reliability': ('Reliability', 'Did it finish successfully?'),
+}
+
+def explain_traits(traits):
+    lines = []
+    for k, v in traits.items():
+        label, desc = TRAIT_TRANSLATIONS.get(k, (k, 'No description.'))
+        lines.append(f"  {label}: {v} — {desc}")
+    return '\n'.join(lines)
+
+# Telemetry lines are buffered and written with one syscall per flush
+_LOG_BUF = []
+_LOG_FLUSH_LINES = 256
+
+def _emit(line):
+    _LOG_BUF.append(line)
+    if len(_LOG_BUF) >= _LOG_FLUSH_LINES:
+        flush_log()
+
+def flush_log():
+    """Write all buffered telemetry lines to stdout"""
+    if _LOG_BUF:
+        sys.stdout.write('\n'.join(_LOG_BUF) + '\n')
+        sys.stdout.flush()
+        _LOG_BUF.clear()
+
+# Lines still buffered when the interpreter exits (sys.exit, fatal errors) are not lost
+atexit.register(flush_log)
+
+def log_print(text):
+    _emit(str(text))
+
+# Decided once at import: colors only on a terminal, math detail unless EXPLORER_QUIET is set
+_IS_TTY = sys.stdout.isatty()
+MATH_OUTPUT = not os.environ.get('EXPLORER_QUIET')
+
+if _IS_TTY:
+    def math_print(text):
+        _emit(_MATH_FMT % (text,))
+
+    def color_print(text, color):
+        fmt = _COLOR_FMT.get(color)
+        _emit(fmt % (text,) if fmt else f"{color}{text}{Colors.END}")
+else:
+    # Piped or collected output gets plain lines without ANSI escapes
+    def math_print(text):
+        _emit(str(text))
+
+    def color_print(text, color):
+        _emit(str(text))
+
+if not MATH_OUTPUT:
+    def math_print(text):
+        pass
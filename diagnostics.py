@@ -1,49 +1,131 @@
 import os
 import json
+import atexit
 import time
-from datetime import datetime
+import queue
+import threading
+from dataclasses import asdict, is_dataclass
+from console import log_print
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+def _json_default(obj):
+    """Stdlib encoder hook for records such as BloomMetrics (orjson encodes dataclasses itself)"""
+    if is_dataclass(obj):
+        return asdict(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+def dumps_json(obj, indent=False):
+    """Encode obj as JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=_json_default).encode('utf-8')
+
+def loads_json(data):
+    """Decode JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Cached second -> formatted timestamp, plus a same-second counter
+_LAST_TS = [0, "", 0]
+
+def timestamp_label():
+    """Return a '%Y%m%d_%H%M%S' label, formatted at most once per second and unique per call"""
+    s = int(time.time())
+    if s != _LAST_TS[0]:
+        _LAST_TS[:] = [s, time.strftime('%Y%m%d_%H%M%S', time.localtime(s)), 0]
+        return _LAST_TS[1]
+    _LAST_TS[2] += 1
+    return f"{_LAST_TS[1]}_{_LAST_TS[2]:03d}"
 
 class Diagnostics:
     def __init__(self, checkpoint_dir='data/checkpoints', interval_minutes=10):
         self.checkpoint_dir = checkpoint_dir
         self.interval = interval_minutes * 60
-        self.last_time_checkpoint = time.time()
+        self._interval_ns = self.interval * 1_000_000_000
+        self.last_time_checkpoint_ns = time.monotonic_ns()
         os.makedirs(self.checkpoint_dir, exist_ok=True)
+        # Checkpoints are written off the hot path by a daemon writer thread
+        self._q = queue.Queue(maxsize=8)
+        # Last (state, encoded bytes); checkpoints of an unchanged state reuse the bytes
+        self._last_encoded = (None, b'')
+        threading.Thread(target=self._writer, daemon=True).start()
+        # Queued snapshots (e.g. the one just before a crash) must reach disk on any exit
+        atexit.register(self.flush)
 
     def save_checkpoint(self, label, state):
-        ts = datetime.now().strftime('%Y%m%d_%H%M%S')
+        ts = timestamp_label()
         fname = f'{label}_checkpoint_{ts}.json'
         path = os.path.join(self.checkpoint_dir, fname)
-        with open(path, 'w') as f:
-            json.dump(state, f, indent=2)
-        print(f'[Diagnostics] Checkpoint saved: {path}')
+        # Encoding now snapshots the state, so later mutation can't race the writer.
+        # Callers hand over a state they no longer mutate, so the same object
+        # checkpointed again (e.g. a cached get_state()) is encoded only once.
+        last_state, data = self._last_encoded
+        if state is not last_state:
+            data = dumps_json(state, indent=True)
+            self._last_encoded = (state, data)
+        item = (path, data)
+        try:
+            self._q.put_nowait(item)
+        except queue.Full:
+            # Drop the oldest pending snapshot; it is stale anyway
+            try:
+                self._q.get_nowait()
+                self._q.task_done()
+            except queue.Empty:
+                pass
+            self._q.put_nowait(item)
+        # Logged here on the caller's thread so it stays in order with the buffered telemetry
+        log_print(f'[Diagnostics] Checkpoint saved: {path}')
+
+    def _writer(self):
+        while True:
+            path, data = self._q.get()
+            try:
+                tmp_path = path + '.tmp'
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except Exception as e:
+                print(f'[Diagnostics] Error saving checkpoint {path}: {e}')
+            finally:
+                self._q.task_done()
+
+    def flush(self):
+        """Block until all pending checkpoints are on disk"""
+        self._q.join()
 
     def maybe_time_checkpoint(self, label, state):
-        now = time.time()
-        if now - self.last_time_checkpoint >= self.interval:
-            self.save_checkpoint(label, state)
-            self.last_time_checkpoint = now
+        """Checkpoint if the interval has elapsed; state may be a callable, evaluated only when due"""
+        now_ns = time.monotonic_ns()
+        if now_ns - self.last_time_checkpoint_ns >= self._interval_ns:
+            self.save_checkpoint(label, state() if callable(state) else state)
+            self.last_time_checkpoint_ns = now_ns
 
     def load_latest_state(self):
         """Load the most recent system state from checkpoints"""
         try:
-            # Find the most recent checkpoint
-            checkpoints = []
-            for filename in os.listdir(self.checkpoint_dir):
-                if filename.endswith('.json'):
-                    filepath = os.path.join(self.checkpoint_dir, filename)
-                    checkpoints.append((filepath, os.path.getmtime(filepath)))
+            # Find the most recent checkpoint in one pass over the directory
+            with os.scandir(self.checkpoint_dir) as it:
+                latest = max(
+                    (e for e in it if e.name.endswith('.json')),
+                    key=lambda e: e.stat().st_mtime,
+                    default=None
+                )
             
-            if not checkpoints:
+            if latest is None:
                 print('[Diagnostics] No previous state found, starting fresh')
                 return None
             
-            # Sort by modification time (newest first)
-            checkpoints.sort(key=lambda x: x[1], reverse=True)
-            latest_checkpoint = checkpoints[0][0]
+            latest_checkpoint = latest.path
             
-            with open(latest_checkpoint, 'r') as f:
-                state = json.load(f)
+            with open(latest_checkpoint, 'rb') as f:
+                state = loads_json(f.read())
             
             print(f'[Diagnostics] Loaded previous state from: {latest_checkpoint}')
             return state
@@ -54,4 +136,4 @@ class Diagnostics:
 
     def report(self, state):
         print('[Diagnostics] Comprehensive System Report:')
-        print(json.dumps(state, indent=2))
+        print(json.dumps(state, indent=2, default=_json_default))
@@ -6,18 +6,73 @@ Intelligent, adaptive, learning operations that prevent infinite loops
 import time
 import random
 import math
+import hashlib
 from datetime import datetime
+from identity import sovereign_hash_id
+
+class ScalableBloomFilter:
+    """Bounded-memory set membership for ever-growing ID sets (false positives, never false negatives)"""
+    
+    def __init__(self, initial_capacity=10000, error_rate=0.001):
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.count = 0
+        self._filters = []  # [bits, bit_count, hash_count, capacity, fill]
+        self._add_filter(initial_capacity, error_rate)
+        
+    def _add_filter(self, capacity, error_rate):
+        bit_count = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        hash_count = max(1, round(bit_count / capacity * math.log(2)))
+        self._filters.append([bytearray((bit_count + 7) // 8), bit_count, hash_count, capacity, 0])
+        
+    @staticmethod
+    def _hashes(key):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+        
+    def __contains__(self, key):
+        h1, h2 = self._hashes(key)
+        for bits, bit_count, hash_count, _, _ in self._filters:
+            for i in range(hash_count):
+                pos = (h1 + i * h2) % bit_count
+                if not bits[pos >> 3] & (1 << (pos & 7)):
+                    break
+            else:
+                return True
+        return False
+        
+    def add(self, key):
+        if key in self:
+            return
+        layer = self._filters[-1]
+        if layer[4] >= layer[3]:
+            # Grow with a tighter error rate so the overall rate stays bounded
+            self._add_filter(layer[3] * 2, self.error_rate * 0.5 ** len(self._filters))
+            layer = self._filters[-1]
+        bits, bit_count, hash_count = layer[0], layer[1], layer[2]
+        h1, h2 = self._hashes(key)
+        for i in range(hash_count):
+            pos = (h1 + i * h2) % bit_count
+            bits[pos >> 3] |= 1 << (pos & 7)
+        layer[4] += 1
+        self.count += 1
+        
+    def __len__(self):
+        """Approximate number of distinct keys added"""
+        return self.count
 
 class DynamicOperations:
     """Generates intelligent, adaptive operations based on system state"""
     
     def __init__(self):
-        self.operation_history = []
+        self.total_operations = 0  # Operations generated so far; only the count is ever read
         self.learning_memory = {}
-        self.defunct_sovereign_ids = set()
+        self.defunct_sovereign_ids = ScalableBloomFilter(initial_capacity=10000, error_rate=0.001)
         self.success_patterns = {}
         self.failure_patterns = {}
         self.operation_templates = self._initialize_templates()
+        self._template_specs = self._compile_templates(self.operation_templates)
+        self._template_names = tuple(self.operation_templates)
         
     def _initialize_templates(self):
         """Initialize operation templates for different scenarios"""
@@ -49,6 +104,17 @@ class DynamicOperations:
             }
         }
     
+    def _compile_templates(self, templates):
+        """Flatten each template into (trait, base, min, max) rows; min/max are None for fixed traits"""
+        specs = {}
+        for name, template in templates.items():
+            ranges = template['variation_range']
+            specs[name] = tuple(
+                (trait, base_value) + tuple(ranges.get(trait, (None, None)))
+                for trait, base_value in template['base_traits'].items()
+            )
+        return specs
+    
     def generate_operations(self, current_state, insight_data, forecast_data):
         """Generate intelligent operations based on current state and insights"""
         operations = []
@@ -86,20 +152,18 @@ class DynamicOperations:
             
         # Apply learning and variation
         operations = self._apply_learning(operations, current_state)
+        self.total_operations += len(operations)
         
         return operations
     
     def _generate_certification_operations(self, count):
         """Generate operations for function certification"""
         operations = []
-        templates = list(self.operation_templates.keys())
+        template_names = random.choices(self._template_names, k=count)
         
-        for i in range(count):
-            template_name = random.choice(templates)
-            template = self.operation_templates[template_name]
-            
+        for i, template_name in enumerate(template_names):
             # Create varied operation
-            operation = self._create_varied_operation(template, f"certification_{i}")
+            operation = self._create_varied_operation(template_name, f"certification_{i}")
             operations.append(operation)
             
         return operations
@@ -110,8 +174,7 @@ class DynamicOperations:
         
         for i in range(count):
             # Focus on high-performance operations
-            template = self.operation_templates['parallelism']
-            operation = self._create_varied_operation(template, f"advancement_{i}")
+            operation = self._create_varied_operation('parallelism', f"advancement_{i}")
             operations.append(operation)
             
         return operations
@@ -122,8 +185,7 @@ class DynamicOperations:
         
         for i in range(count):
             # Focus on reliable operations
-            template = self.operation_templates['load_balancing']
-            operation = self._create_varied_operation(template, f"stability_{i}")
+            operation = self._create_varied_operation('load_balancing', f"stability_{i}")
             operations.append(operation)
             
         return operations
@@ -134,8 +196,7 @@ class DynamicOperations:
         
         for i in range(count):
             # Focus on basic, reliable operations
-            template = self.operation_templates['resource_optimization']
-            operation = self._create_varied_operation(template, f"recovery_{i}")
+            operation = self._create_varied_operation('resource_optimization', f"recovery_{i}")
             operations.append(operation)
             
         return operations
@@ -147,47 +208,46 @@ class DynamicOperations:
         
         # Choose templates based on current function count
         if function_count == 0:
-            templates = ['resource_optimization', 'feature_expansion']
+            templates = ('resource_optimization', 'feature_expansion')
         elif function_count < 3:
-            templates = ['parallelism', 'load_balancing']
+            templates = ('parallelism', 'load_balancing')
         else:
-            templates = ['fixed_point', 'feature_expansion']
+            templates = ('fixed_point', 'feature_expansion')
             
-        for i in range(count):
-            template_name = random.choice(templates)
-            template = self.operation_templates[template_name]
-            operation = self._create_varied_operation(template, f"adaptive_{i}")
+        for i, template_name in enumerate(random.choices(templates, k=count)):
+            operation = self._create_varied_operation(template_name, f"adaptive_{i}")
             operations.append(operation)
             
         return operations
     
-    def _create_varied_operation(self, template, operation_id):
+    def _create_varied_operation(self, template_name, operation_id):
         """Create a varied operation based on template"""
         traits = {}
+        uniform = random.uniform
         
-        for trait, base_value in template['base_traits'].items():
-            if trait in template['variation_range']:
-                min_val, max_val = template['variation_range'][trait]
+        for trait, base_value, min_val, max_val in self._template_specs[template_name]:
+            if min_val is not None:
                 # Add some randomness while staying within bounds
-                variation = random.uniform(0.8, 1.2)
+                variation = uniform(0.8, 1.2)
                 traits[trait] = max(min_val, min(max_val, base_value * variation))
             else:
                 traits[trait] = base_value
                 
         # Generate sovereign hash-based identifier for dynamic operation
-        from identity import sovereign_hash_id
+        generation_time = time.time()
         operation_traits = {
             'operation_id': operation_id,
             'traits': traits,
-            'generation_time': time.time()
+            'generation_time': generation_time
         }
-        sovereign_id = f"hash-{sovereign_hash_id(operation_traits)}"
+        # generation_time makes every definition unique, so a memo would only ever miss
+        sovereign_id = f"hash-{sovereign_hash_id(operation_traits, memoize=False)}"
         
         return {
             'traits': traits,
             'sovereign_id': sovereign_id,  # Sovereign hash-based identifier
-            'template': template,
-            'generation_time': time.time()
+            'template': self.operation_templates[template_name],
+            'generation_time': generation_time
         }
     
     def _apply_learning(self, operations, current_state):
@@ -208,7 +268,12 @@ class DynamicOperations:
     def _get_operation_key(self, operation):
         """Generate a key for operation pattern matching"""
         traits = operation['traits']
-        return f"{traits.get('execution_time_ms', 0):.0f}_{traits.get('memory_kb', 0):.0f}"
+        return self._pack_operation_key(traits.get('execution_time_ms', 0), traits.get('memory_kb', 0))
+    
+    @staticmethod
+    def _pack_operation_key(execution_time_ms, memory_kb):
+        """Pack rounded (ms, kb) into one int; same buckets as the old '{ms:.0f}_{kb:.0f}' string key"""
+        return (round(execution_time_ms) << 32) | round(memory_kb)
     
     def _adjust_for_failures(self, operation, failure_data):
         """Adjust operation to avoid previous failures"""
@@ -230,24 +295,17 @@ class DynamicOperations:
     
     def record_operation_result(self, operation_sovereign_id, success, vp_value):
         """Record the result of an operation for learning"""
-        operation_key = self._get_operation_key({'traits': {'execution_time_ms': vp_value * 100, 'memory_kb': vp_value * 1000}})
+        operation_key = self._pack_operation_key(vp_value * 100, vp_value * 1000)
+        patterns = self.success_patterns if success else self.failure_patterns
         
-        if success:
-            if operation_key not in self.success_patterns:
-                self.success_patterns[operation_key] = {'count': 0, 'avg_vp': 0}
-            self.success_patterns[operation_key]['count'] += 1
-            self.success_patterns[operation_key]['avg_vp'] = (
-                (self.success_patterns[operation_key]['avg_vp'] * (self.success_patterns[operation_key]['count'] - 1) + vp_value) /
-                self.success_patterns[operation_key]['count']
-            )
-        else:
-            if operation_key not in self.failure_patterns:
-                self.failure_patterns[operation_key] = {'count': 0, 'avg_vp': 0}
-            self.failure_patterns[operation_key]['count'] += 1
-            self.failure_patterns[operation_key]['avg_vp'] = (
-                (self.failure_patterns[operation_key]['avg_vp'] * (self.failure_patterns[operation_key]['count'] - 1) + vp_value) /
-                self.failure_patterns[operation_key]['count']
-            )
+        pattern = patterns.get(operation_key)
+        if pattern is None:
+            pattern = patterns[operation_key] = {'count': 0, 'avg_vp': 0}
+        # Incremental (Welford) running mean
+        pattern['count'] += 1
+        pattern['avg_vp'] += (vp_value - pattern['avg_vp']) / pattern['count']
+        
+        if not success:
             self.defunct_sovereign_ids.add(operation_sovereign_id)
     
     def get_learning_stats(self):
@@ -256,5 +314,5 @@ class DynamicOperations:
             'success_patterns': len(self.success_patterns),
             'failure_patterns': len(self.failure_patterns),
             'defunct_sovereign_ids': len(self.defunct_sovereign_ids),
-            'total_operations': len(self.operation_history)
+            'total_operations': self.total_operations
         }
@@ -1,22 +1,68 @@
 import hashlib
 import json
+from collections import deque
 
-def sovereign_hash_id(traits, namespace="explorer"):
+# Memo of canonical definition bytes -> sovereign id, evicted FIFO
+_HASH_CACHE_SIZE = 4096
+_HASH_CACHE = {}
+_HASH_CACHE_ORDER = deque()
+
+def _canonical_encode(obj, out):
+    """
+    Canonically encode obj into the bytearray out (bencode-style).
+    Dict keys are sorted, so equal definitions always yield equal bytes.
+    """
+    if isinstance(obj, dict):
+        out += b'd'
+        for key in sorted(obj):
+            _canonical_encode(str(key), out)
+            _canonical_encode(obj[key], out)
+        out += b'e'
+    elif isinstance(obj, (list, tuple)):
+        out += b'l'
+        for item in obj:
+            _canonical_encode(item, out)
+        out += b'e'
+    elif isinstance(obj, str):
+        data = obj.encode('utf-8')
+        out += b's%d:' % len(data)
+        out += data
+    elif obj is None:
+        out += b'n'
+    elif obj is True:
+        out += b't'
+    elif obj is False:
+        out += b'f'
+    elif isinstance(obj, int):
+        out += b'i%de' % obj
+    elif isinstance(obj, float):
+        out += b'r' + repr(obj).encode('ascii') + b'e'
+    else:
+        raise TypeError(f"Cannot canonically encode {type(obj).__name__}")
+
+def sovereign_hash_id(traits, namespace="explorer", memoize=True):
     """
     Generate sovereign identifier where identity = definition.
     The hash IS the identity - no separation between entity and its definition possible.
+    Pass memoize=False for definitions that never repeat (e.g. ones carrying a timestamp).
     """
     # Include namespace in the sovereign definition
-    sovereign_definition = {
-        "namespace": namespace,
-        "traits": traits
-    }
-    
-    # Serialize the complete sovereign definition
-    serialized = json.dumps(sovereign_definition, sort_keys=True)
+    buf = bytearray(b'n')
+    _canonical_encode(namespace, buf)
+    _canonical_encode(traits, buf)
+    key = bytes(buf)
+    if not memoize:
+        return hashlib.blake2b(key, digest_size=8).hexdigest()
     
-    # The hash IS the identity - perfect integrity guaranteed
-    return hashlib.sha256(serialized.encode()).hexdigest()[:16]
+    sovereign_id = _HASH_CACHE.get(key)
+    if sovereign_id is None:
+        # The hash IS the identity - perfect integrity guaranteed
+        sovereign_id = hashlib.blake2b(key, digest_size=8).hexdigest()
+        if len(_HASH_CACHE_ORDER) >= _HASH_CACHE_SIZE:
+            del _HASH_CACHE[_HASH_CACHE_ORDER.popleft()]
+        _HASH_CACHE[key] = sovereign_id
+        _HASH_CACHE_ORDER.append(key)
+    return sovereign_id
 
 def canonical_serialize(entity_state: dict) -> str:
     """
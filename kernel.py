@@ -1,14 +1,20 @@
 import os
-import json
-import shutil
-import time
+from diagnostics import timestamp_label, dumps_json, loads_json
+
+# Number of journaled amendments folded into each full snapshot
+SNAPSHOT_INTERVAL = 256
 
 class Kernel:
-    def __init__(self, kernel_dir='data/kernel', link_name='latest.link'):
+    def __init__(self, kernel_dir='data/kernel', link_name='latest.link', durable=False):
+        self.durable = durable  # fsync kernel files before they become visible
         self.kernel_dir = os.path.abspath(kernel_dir)
         self.versions_dir = os.path.join(self.kernel_dir, 'versions')
         self.latest_link = os.path.join(self.kernel_dir, link_name)
+        self.journal = os.path.join(self.kernel_dir, 'kernel.journal')
         self.sovereign_ids = []
+        self._id_set = set()  # O(1) membership sidecar for sovereign_ids
+        self._journal_len = 0  # Amendments recorded since the latest snapshot
+        self._needs_snapshot = False  # Set when a removal must be persisted
         self.version_file = None
         self._load_state()
 
@@ -19,53 +25,109 @@ class Kernel:
             version_path = os.path.join(self.versions_dir, version_filename)
             self.version_file = version_path
             if os.path.exists(version_path):
-                with open(version_path, 'r') as f:
-                    self.sovereign_ids = json.load(f)
+                with open(version_path, 'rb') as f:
+                    self.sovereign_ids = loads_json(f.read())
         else:
             self.sovereign_ids = []
             self.version_file = None
+        self._id_set = set(self.sovereign_ids)
+        # Replay amendments journaled since the snapshot
+        entries = self._read_journal()
+        for sovereign_id in entries:
+            if sovereign_id not in self._id_set:
+                self._id_set.add(sovereign_id)
+                self.sovereign_ids.append(sovereign_id)
+        self._journal_len = len(entries)
+        self._needs_snapshot = False
 
     def amend(self, new_sovereign_id):
         """
-        Add a new certified function sovereign ID to the kernel and create a new version.
-        Atomically update latest.link to point to the new version file.
+        Add a new certified function sovereign ID to the kernel.
+        The ID is appended to the journal; every SNAPSHOT_INTERVAL amendments the
+        full kernel is written to a new version file and latest.link is atomically updated.
         """
         # Only add if sovereign ID is not already present (deduplication)
-        if new_sovereign_id not in self.sovereign_ids:
+        if new_sovereign_id not in self._id_set:
+            if self._needs_snapshot or self._journal_len >= SNAPSHOT_INTERVAL:
+                self._write_snapshot()
+            self._id_set.add(new_sovereign_id)
             self.sovereign_ids.append(new_sovereign_id)
-            timestamp = time.strftime('%Y%m%d_%H%M%S')
-            version_filename = f'kernel_{timestamp}.json'
-            version_path = os.path.join(self.versions_dir, version_filename)
-            with open(version_path, 'w') as f:
-                json.dump(self.sovereign_ids, f)
-            # Atomically update latest.link as a text file
-            tmp_link = self.latest_link + '.tmp'
-            with open(tmp_link, 'w') as f:
-                f.write(version_filename)
-            os.replace(tmp_link, self.latest_link)
-            self.version_file = version_path
+            with open(self.journal, 'ab', buffering=0) as f:
+                f.write((new_sovereign_id + '\n').encode('utf-8'))
+                if self.durable:
+                    os.fsync(f.fileno())
+            self._journal_len += 1
             return True  # Sovereign ID was added
         else:
             return False  # Sovereign ID already exists
 
     def rollback(self):
         """
-        Atomically switch latest.link back to the previous kernel version file.
+        Undo the most recent amendment: drop the last journal entry, or when the
+        journal is empty write a new snapshot without the snapshot's last ID.
         """
-        # Find previous version file
-        versions = sorted(os.listdir(self.versions_dir))
-        if len(versions) < 2:
-            return False  # No previous version to roll back to
-        prev_version = versions[-2]
-        prev_path = os.path.join(self.versions_dir, prev_version)
+        if self._journal_len > 0:
+            entries = self._read_journal()
+            last = entries.pop()
+            self._write_journal(entries)
+            # Nothing was appended after the last journal entry, so if present it is the tail
+            if last in self._id_set:
+                self._id_set.remove(last)
+                self.sovereign_ids.pop()
+            return True
+        if not self.sovereign_ids:
+            return False  # Nothing to roll back
+        self._id_set.discard(self.sovereign_ids.pop())
+        self._write_snapshot()
+        return True
+
+    def _write_snapshot(self):
+        """Write the full kernel to a new version file and start an empty journal"""
+        timestamp = timestamp_label()
+        version_filename = f'kernel_{timestamp}.json'
+        version_path = os.path.join(self.versions_dir, version_filename)
+        self._write_file(version_path, dumps_json(self.sovereign_ids))
+        self._update_link(version_filename)
+        self.version_file = version_path
+        self._write_journal([])
+        self._needs_snapshot = False
+
+    def _update_link(self, version_filename):
         # Atomically update latest.link as a text file
         tmp_link = self.latest_link + '.tmp'
-        with open(tmp_link, 'w') as f:
-            f.write(prev_version)
+        self._write_file(tmp_link, version_filename.encode('utf-8'))
         os.replace(tmp_link, self.latest_link)
-        self.version_file = prev_path
-        with open(prev_path, 'r') as f:
-            self.sovereign_ids = json.load(f)
+
+    def _write_file(self, path, data):
+        # One binary write; fsync only when durability was requested
+        with open(path, 'wb') as f:
+            f.write(data)
+            if self.durable:
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _read_journal(self):
+        try:
+            with open(self.journal, 'rb') as f:
+                data = f.read().decode('utf-8')
+        except FileNotFoundError:
+            return []
+        return data.split('\n')[:-1]
+
+    def _write_journal(self, entries):
+        tmp_journal = self.journal + '.tmp'
+        self._write_file(tmp_journal, ''.join(e + '\n' for e in entries).encode('utf-8'))
+        os.replace(tmp_journal, self.journal)
+        self._journal_len = len(entries)
+
+    def discard(self, sovereign_id):
+        """Remove a sovereign ID in memory; the next amend persists the change"""
+        if sovereign_id not in self._id_set:
+            return False
+        self._id_set.remove(sovereign_id)
+        self.sovereign_ids.remove(sovereign_id)
+        # The journal only records additions, so removals need a snapshot
+        self._needs_snapshot = True
         return True
 
     def get_sovereign_ids(self):
@@ -1,87 +1,90 @@
 
 
 import time
+import bisect
+from types import MappingProxyType
 from sentinel import Sentinel
 from kernel import Kernel
 from diagnostics import Diagnostics
 from breath_engine import BreathEngine
 from mirror_systems import MirrorOfInsight, MirrorOfPortent, BloomSystem
 from dynamic_operations import DynamicOperations
+from metrics import PerformanceRing
+from identity import sovereign_hash_id
+from console import Colors, flush_log, log_print, math_print, color_print
 
-# ANSI color codes for Windows terminal
+# Number of recent measurements the stability center learns from
+PERFORMANCE_WINDOW = 100
 
-class Colors:
-    RED = '\033[91m'
-    GREEN = '\033[92m'
-    BLUE = '\033[94m'
-    CYAN = '\033[96m'
-    YELLOW = '\033[93m'
-    GRAY = '\033[90m'
-    ORANGE = '\033[38;5;214m'  # Orange/Gold for math
-    END = '\033[0m'
-
-TRAIT_TRANSLATIONS = {
-    'speed_ms': ('Speed (ms)', 'How fast did it run?'),
-    'memory_mb': ('Memory (MB)', 'How much computer memory did it use?'),
-    'reliability': ('Reliability', 'Did it finish successfully?'),
+# Dynamic operation trait names -> stability center trait names
+_TRAIT_RENAME = {
+    'execution_time_ms': 'speed_ms',
+    'memory_kb': 'memory_mb',
+    'terminated': 'reliability',
 }
+_TRAIT_SCALE = {'memory_kb': 1 / 1024}  # Convert KB to MB
 
-def explain_traits(traits):
-    lines = []
-    for k, v in traits.items():
-        label, desc = TRAIT_TRANSLATIONS.get(k, (k, 'No description.'))
-        lines.append(f"  {label}: {v} — {desc}")
-    return '\n'.join(lines)
-
-def math_print(text):
-    print(f"{Colors.ORANGE}{text}{Colors.END}")
+# Per-phase banner text: (inhale mood, exhale mood, math preamble)
+_PHASE_BANNERS = {
+    'Genesis Phase': (
+        "System gathering chaos...",
+        "System releasing order...",
+        "[Math] VP = sum(abs(actual - ideal) / envelope) for each trait.",
+    ),
+    'Sovereign Phase': (
+        "Lawful Kernel gathering order...",
+        "Lawful Kernel releasing wisdom...",
+        "[Math] All VP calculations and certification steps will be shown in detail below.",
+    ),
+}
 
-def color_print(text, color):
-    print(f"{color}{text}{Colors.END}")
+# Modular improvement triggers; static, so built once at import
+IMPROVEMENT_TRIGGERS = (
+    # Resource optimization
+    MappingProxyType({
+        'name': 'resource_optimization',
+        'func_path': 'test_func1.py',
+        'inputs': (1, 2, 3),
+        'desc': 'Seeking more efficient primitive recursive function.'
+    }),
+    # Parallelism
+    MappingProxyType({
+        'name': 'parallelism',
+        'func_path': 'test_func2.py',
+        'inputs': (4, 5, 6),
+        'desc': 'Seeking parallelizable primitive recursive function.'
+    }),
+    # Feature expansion
+    MappingProxyType({
+        'name': 'feature_expansion',
+        'func_path': 'test_func3.py',
+        'inputs': (7, 8, 9),
+        'desc': 'Seeking new operational capability.'
+    }),
+    # Load balancing/fault tolerance
+    MappingProxyType({
+        'name': 'load_balancing',
+        'func_path': 'test_func4.py',
+        'inputs': (10, 11, 12),
+        'desc': 'Seeking redundant or alternative function.'
+    }),
+    # Fixed-point/self-replication (Kleene)
+    MappingProxyType({
+        'name': 'fixed_point',
+        'func_path': 'test_func5.py',
+        'inputs': (13, 14, 15),
+        'desc': 'Seeking self-referential primitive recursive function.'
+    }),
+)
 
 class BiphasicController:
     def improvement_triggers(self):
-        triggers = []
-        # Resource optimization
-        triggers.append({
-            'name': 'resource_optimization',
-            'func_path': 'test_func1.py',
-            'inputs': [1, 2, 3],
-            'desc': 'Seeking more efficient primitive recursive function.'
-        })
-        # Parallelism
-        triggers.append({
-            'name': 'parallelism',
-            'func_path': 'test_func2.py',
-            'inputs': [4, 5, 6],
-            'desc': 'Seeking parallelizable primitive recursive function.'
-        })
-        # Feature expansion
-        triggers.append({
-            'name': 'feature_expansion',
-            'func_path': 'test_func3.py',
-            'inputs': [7, 8, 9],
-            'desc': 'Seeking new operational capability.'
-        })
-        # Load balancing/fault tolerance
-        triggers.append({
-            'name': 'load_balancing',
-            'func_path': 'test_func4.py',
-            'inputs': [10, 11, 12],
-            'desc': 'Seeking redundant or alternative function.'
-        })
-        # Fixed-point/self-replication (Kleene)
-        triggers.append({
-            'name': 'fixed_point',
-            'func_path': 'test_func5.py',
-            'inputs': [13, 14, 15],
-            'desc': 'Seeking self-referential primitive recursive function.'
-        })
-        return triggers
+        return IMPROVEMENT_TRIGGERS
+
     def __init__(self):
         # Initialize systems
         self.kernel = Kernel()
-        self.sentinel = Sentinel()
+        self.sentinel = Sentinel(kernel=self.kernel)
         self.diagnostics = Diagnostics()
         self.breath_engine = BreathEngine()
         self.mirror_of_insight = MirrorOfInsight()
@@ -90,16 +93,29 @@ class BiphasicController:
         self.dynamic_operations = DynamicOperations()
         
         # Connect systems for mathematical capability assessment
-        self.sentinel.mirror_of_insight = self.mirror_of_insight
-        self.sentinel.breath_engine = self.breath_engine
-        self.sentinel.bloom_system = self.bloom_system
-        self.sentinel.dynamic_operations = self.dynamic_operations
+        self.sentinel.register_subsystems(
+            mirror=self.mirror_of_insight,
+            breath=self.breath_engine,
+            bloom=self.bloom_system,
+            dyn_ops=self.dynamic_operations
+        )
         
         # Dynamic stability system that learns from performance
-        self.performance_history = []
+        self.performance_history = PerformanceRing()
+        # Sorted copies of the speed/memory window, kept in step with the ring
+        self._sorted_speeds = []
+        self._sorted_memories = []
         self.stability_center = self._initialize_stability_center()
         self.stability_envelope = self._initialize_stability_envelope()
         
+        # get_state() is memoized until the next breath or state change
+        self._state_tick = 0
+        self._cached_state = None
+        self._cached_state_tick = -1
+        self._last_vp_entry = None
+        self._bloom_event_active = False
+        self.stop_requested = False  # Set by the signal handler; the phase loops exit on it
+        
         # Load previous state or start fresh
         self.phase = self._load_previous_state()
 
@@ -150,42 +166,65 @@ class BiphasicController:
 
     def _update_stability_from_performance(self, traits):
         """Update stability center based on actual performance"""
-        self.performance_history.append(traits)
+        history = self.performance_history
+        speeds, memories = self._sorted_speeds, self._sorted_memories
+        if len(history) >= PERFORMANCE_WINDOW:
+            # The oldest windowed measurement leaves as the new one arrives
+            del speeds[bisect.bisect_left(speeds, history.at_age(history.speed_ms, PERFORMANCE_WINDOW))]
+            del memories[bisect.bisect_left(memories, history.at_age(history.memory_mb, PERFORMANCE_WINDOW))]
+        history.append(traits)
+        # Insert the stored (float) values so later removals match exactly
+        bisect.insort(speeds, history.at_age(history.speed_ms, 1))
+        bisect.insort(memories, history.at_age(history.memory_mb, 1))
         
-        # Keep only last 100 measurements
-        if len(self.performance_history) > 100:
-            self.performance_history = self.performance_history[-100:]
-        
-        # Calculate new ideal values based on best performance
-        if len(self.performance_history) >= 5:
-            speeds = [p['speed_ms'] for p in self.performance_history]
-            memories = [p['memory_mb'] for p in self.performance_history]
-            
+        # Calculate new ideal values based on the last PERFORMANCE_WINDOW measurements
+        n = len(speeds)
+        if n >= 5:
             # Use 25th percentile as ideal (good but achievable)
-            speeds.sort()
-            memories.sort()
-            ideal_speed = speeds[len(speeds) // 4]  # 25th percentile
-            ideal_memory = memories[len(memories) // 4]  # 25th percentile
+            ideal_speed = speeds[n // 4]  # 25th percentile
+            ideal_memory = memories[n // 4]  # 25th percentile
             
             # Update stability center with learned values
             self.stability_center['speed_ms'] = max(10.0, ideal_speed)  # Minimum 10ms
             self.stability_center['memory_mb'] = max(1.0, ideal_memory)  # Minimum 1MB
             
             # Update envelope based on observed range
-            speed_range = max(speeds) - min(speeds)
-            memory_range = max(memories) - min(memories)
+            min_speed, max_speed = speeds[0], speeds[-1]
+            min_memory, max_memory = memories[0], memories[-1]
+            speed_range = max_speed - min_speed
+            memory_range = max_memory - min_memory
             
             # Dynamic envelope that adapts to observed performance
             self.stability_envelope['speed_ms'] = (
-                max(5.0, min(speeds) - speed_range * 0.1),
-                max(speeds) + speed_range * 0.1
+                max(5.0, min_speed - speed_range * 0.1),
+                max_speed + speed_range * 0.1
             )
             self.stability_envelope['memory_mb'] = (
-                max(0.5, min(memories) - memory_range * 0.1),
-                max(memories) + memory_range * 0.1
+                max(0.5, min_memory - memory_range * 0.1),
+                max_memory + memory_range * 0.1
             )
 
+    def _new_experiment_traits(self):
+        """Traits of the latest VP history entry, or None if it was already learned from"""
+        vp_history = self.sentinel.vp_history
+        if not vp_history or vp_history[-1] is self._last_vp_entry:
+            return None
+        # Identity rather than length, so a capped history still registers new entries
+        self._last_vp_entry = vp_history[-1]
+        return self._last_vp_entry['traits']
+
+    def _breathe(self):
+        """Advance the breath engine; a new breath starts a new state tick"""
+        breath_data = self.breath_engine.breathe()
+        self._state_tick += 1
+        return breath_data
+
+    def _invalidate_state(self):
+        self._state_tick += 1
+
     def get_state(self):
+        if self._cached_state_tick == self._state_tick:
+            return self._cached_state
         # Collect key system state for diagnostics
         breath_state = self.breath_engine.get_breath_state()
         base_state = {
@@ -206,19 +245,19 @@ class BiphasicController:
             'learning_stats': self.dynamic_operations.get_learning_stats()
         })
         
+        self._cached_state = base_state
+        self._cached_state_tick = self._state_tick
         return base_state
 
-    def run_genesis_phase(self):
-        # Breathe first - the living pulse
-        breath_data = self.breath_engine.breathe()
-        breath_pulse = self.breath_engine.get_breath_pulse()
-        
+    def _log_phase_banner(self, phase_label, breath_data, breath_pulse):
+        """Log the breath, mirror and bloom status that opens every phase cycle; returns the state"""
+        inhale, exhale, math_line = _PHASE_BANNERS[phase_label]
         if self.breath_engine.is_inhale_phase():
-            color_print(f"[Genesis Phase] 🜂 BREATH INHALE - Pulse: {breath_pulse:.3f} - System gathering chaos...", Colors.CYAN)
+            color_print(f"[{phase_label}] 🜂 BREATH INHALE - Pulse: {breath_pulse:.3f} - {inhale}", Colors.CYAN)
         else:
-            color_print(f"[Genesis Phase] 🜂 BREATH EXHALE - Pulse: {breath_pulse:.3f} - System releasing order...", Colors.CYAN)
+            color_print(f"[{phase_label}] 🜂 BREATH EXHALE - Pulse: {breath_pulse:.3f} - {exhale}", Colors.CYAN)
             
-        math_print("[Math] VP = sum(abs(actual - ideal) / envelope) for each trait.")
+        math_print(math_line)
         math_print(f"[Breath] Cycle: {breath_data['cycle_count']}, Depth: {breath_data['depth']:.3f}")
         
         # Mirror reflection and foresight
@@ -229,8 +268,55 @@ class BiphasicController:
         
         color_print(f"[Mirror of Insight] 🜂 Stability: {insight_data['stability_assessment']['level']} (Score: {insight_data['stability_assessment']['score']:.3f})", Colors.YELLOW)
         color_print(f"[Mirror of Portent] 🜂 Forecast: {forecast_data['short_term']['stability_trend']} trend, {len(forecast_data['warnings'])} warnings", Colors.YELLOW)
-        color_print(f"[Bloom System] 🜂 Natural unfolding: {bloom_data['natural_unfolding']} (Curvature: {bloom_data['bloom_curvature']:.3f})", Colors.YELLOW)
-        color_print(f"[Bloom System] 🜂 Breath resonance: {bloom_data['breath_resonance']:.3f}, Maturity: {bloom_data['bloom_maturity']} (Cycle {bloom_data['bloom_cycles']})", Colors.YELLOW)
+        color_print(f"[Bloom System] 🜂 Natural unfolding: {bloom_data.natural_unfolding} (Curvature: {bloom_data.bloom_curvature:.3f})", Colors.YELLOW)
+        color_print(f"[Bloom System] 🜂 Breath resonance: {bloom_data.breath_resonance:.3f}, Maturity: {bloom_data.bloom_maturity} (Cycle {bloom_data.bloom_cycles})", Colors.YELLOW)
+        return current_state
+
+    def _certify_and_register(self, func_path, inputs, trait_builder, announce=None, log_result=False):
+        """
+        Run a genesis experiment, learn from its performance and, if certified,
+        amend the kernel with the id of trait_builder(vp_values). Returns certified.
+        """
+        certified, vp_values = self.sentinel.run_genesis_experiment(
+            func_path=func_path,
+            test_inputs=inputs,
+            stability_center=self.stability_center,
+            stability_envelope=self.stability_envelope
+        )
+        
+        # Update stability system with measured performance
+        if vp_values:
+            # Get the traits from the last experiment
+            traits = self._new_experiment_traits()
+            if traits:
+                self._update_stability_from_performance(traits)
+                color_print(f"[Stability] Updated ideals - Speed: {self.stability_center['speed_ms']:.1f}ms, Memory: {self.stability_center['memory_mb']:.1f}MB", Colors.CYAN)
+        if log_result:
+            log_print(f"Function {func_path} certified: {certified}, VP values: {vp_values}")
+        if certified:
+            self._register_certified(trait_builder(vp_values), announce)
+        return certified
+
+    def _register_certified(self, traits, announce=None):
+        """Amend the kernel with the sovereign hash id of a certified definition"""
+        # Generate sovereign hash-based identifier
+        sovereign_id = f"hash-{sovereign_hash_id(traits)}"
+        if announce:
+            color_print(f"{announce}: {sovereign_id}", Colors.GREEN)
+        added = self.kernel.amend(sovereign_id)
+        self._invalidate_state()
+        if added:
+            color_print(f"[Kernel] Added new sovereign ID: {sovereign_id}", Colors.GREEN)
+        else:
+            color_print(f"[Kernel] Sovereign ID already exists: {sovereign_id}", Colors.YELLOW)
+        self.diagnostics.save_checkpoint('certification', self.get_state())
+        return sovereign_id
+
+    def run_genesis_phase(self):
+        # Breathe first - the living pulse
+        breath_data = self._breathe()
+        breath_pulse = self.breath_engine.get_breath_pulse()
+        self._log_phase_banner('Genesis Phase', breath_data, breath_pulse)
         
         # Example: Discover and certify functions
         test_functions = [
@@ -240,35 +326,14 @@ class BiphasicController:
         
         for func in test_functions:
             # Breathe between each function test
-            self.breath_engine.breathe()
+            self._breathe()
             
-            certified, vp_values = self.sentinel.run_genesis_experiment(
-                func_path=func['func_path'],
-                test_inputs=func['inputs'],
-                stability_center=self.stability_center,
-                stability_envelope=self.stability_envelope
+            self._certify_and_register(
+                func['func_path'], func['inputs'],
+                lambda vp_values, path=func['func_path']: {'func_path': path, 'vp_values': vp_values},
+                log_result=True
             )
-            
-            # Update stability system with measured performance
-            if vp_values:
-                # Get the traits from the last experiment
-                traits = self.sentinel.vp_history[-1]['traits'] if self.sentinel.vp_history else {}
-                if traits:
-                    self._update_stability_from_performance(traits)
-                    color_print(f"[Stability] Updated ideals - Speed: {self.stability_center['speed_ms']:.1f}ms, Memory: {self.stability_center['memory_mb']:.1f}MB", Colors.CYAN)
-            print(f"Function {func['func_path']} certified: {certified}, VP values: {vp_values}")
-            if certified:
-                # Generate sovereign hash-based identifier
-                from identity import sovereign_hash_id
-                traits = {'func_path': func['func_path'], 'vp_values': vp_values}
-                sovereign_id = f"hash-{sovereign_hash_id(traits)}"
-                added = self.kernel.amend(sovereign_id)
-                if added:
-                    color_print(f"[Kernel] Added new sovereign ID: {sovereign_id}", Colors.GREEN)
-                else:
-                    color_print(f"[Kernel] Sovereign ID already exists: {sovereign_id}", Colors.YELLOW)
-                self.diagnostics.save_checkpoint('certification', self.get_state())
-            self.diagnostics.maybe_time_checkpoint('time', self.get_state())
+            self.diagnostics.maybe_time_checkpoint('time', self.get_state)
             
         # Check for mathematical capability and phase transition
         current_sovereign_ids = self.kernel.get_sovereign_ids()
@@ -276,35 +341,19 @@ class BiphasicController:
         color_print(f"[Genesis] Checking mathematical capability for understanding...", Colors.CYAN)
         
         if self.sentinel.check_critical_mass():
-            print("[Genesis Phase] 🜂 MATHEMATICAL CAPABILITY ACHIEVED - System understands through mathematics!")
-            print("[Genesis Phase] 🜂 Initiating The Great Inauguration...")
+            log_print("[Genesis Phase] 🜂 MATHEMATICAL CAPABILITY ACHIEVED - System understands through mathematics!")
+            log_print("[Genesis Phase] 🜂 Initiating The Great Inauguration...")
             self.diagnostics.save_checkpoint('phase_transition', self.get_state())
             return True
         return False
 
     def run_sovereign_phase(self):
         # Breathe first - the living pulse
-        breath_data = self.breath_engine.breathe()
+        breath_data = self._breathe()
         breath_pulse = self.breath_engine.get_breath_pulse()
-        
-        if self.breath_engine.is_inhale_phase():
-            color_print(f"[Sovereign Phase] 🜂 BREATH INHALE - Pulse: {breath_pulse:.3f} - Lawful Kernel gathering order...", Colors.CYAN)
-        else:
-            color_print(f"[Sovereign Phase] 🜂 BREATH EXHALE - Pulse: {breath_pulse:.3f} - Lawful Kernel releasing wisdom...", Colors.CYAN)
-            
-        math_print("[Math] All VP calculations and certification steps will be shown in detail below.")
-        math_print(f"[Breath] Cycle: {breath_data['cycle_count']}, Depth: {breath_data['depth']:.3f}")
-        
-        # Mirror reflection and foresight
-        current_state = self.get_state()
+        current_state = self._log_phase_banner('Sovereign Phase', breath_data, breath_pulse)
         insight_data = current_state['insight_data']
         forecast_data = current_state['forecast_data']
-        bloom_data = current_state['bloom_data']
-        
-        color_print(f"[Mirror of Insight] 🜂 Stability: {insight_data['stability_assessment']['level']} (Score: {insight_data['stability_assessment']['score']:.3f})", Colors.YELLOW)
-        color_print(f"[Mirror of Portent] 🜂 Forecast: {forecast_data['short_term']['stability_trend']} trend, {len(forecast_data['warnings'])} warnings", Colors.YELLOW)
-        color_print(f"[Bloom System] 🜂 Natural unfolding: {bloom_data['natural_unfolding']} (Curvature: {bloom_data['bloom_curvature']:.3f})", Colors.YELLOW)
-        color_print(f"[Bloom System] 🜂 Breath resonance: {bloom_data['breath_resonance']:.3f}, Maturity: {bloom_data['bloom_maturity']} (Cycle {bloom_data['bloom_cycles']})", Colors.YELLOW)
         
         # Display learning statistics
         learning_stats = current_state['learning_stats']
@@ -316,8 +365,9 @@ class BiphasicController:
         for opportunity in forecast_data['opportunities']:
             color_print(f"[Opportunity] {opportunity['description']}", Colors.GREEN)
             
-        # Check for bloom events
-        if self.bloom_system.should_trigger_bloom_event():
+        # Check for bloom events; evaluated once per cycle and reused by run()
+        self._bloom_event_active = self.bloom_system.should_trigger_bloom_event()
+        if self._bloom_event_active:
             color_print(f"[Bloom Event] 🜂 🌸 NATURAL UNFOLDING TRIGGERED - System resonance at peak!", Colors.GREEN)
             color_print(f"[Bloom Event] 🜂 🌸 Accelerating operations and enhancing breath resonance", Colors.GREEN)
         
@@ -326,36 +376,15 @@ class BiphasicController:
         
         for trig in triggers:
             # Breathe between each improvement trigger
-            self.breath_engine.breathe()
+            self._breathe()
             
             color_print(f"[Improvement] {trig['desc']}", Colors.YELLOW)
-            certified, vp_values = self.sentinel.run_genesis_experiment(
-                func_path=trig['func_path'],
-                test_inputs=trig['inputs'],
-                stability_center=self.stability_center,
-                stability_envelope=self.stability_envelope
+            self._certify_and_register(
+                trig['func_path'], trig['inputs'],
+                lambda vp_values, trig=trig: {'replacement_type': trig['name'], 'vp_values': vp_values, 'func_path': trig['func_path']},
+                announce="[Improvement] Certified new function"
             )
-            
-            # Update stability system with measured performance
-            if vp_values:
-                # Get the traits from the last experiment
-                traits = self.sentinel.vp_history[-1]['traits'] if self.sentinel.vp_history else {}
-                if traits:
-                    self._update_stability_from_performance(traits)
-                    color_print(f"[Stability] Updated ideals - Speed: {self.stability_center['speed_ms']:.1f}ms, Memory: {self.stability_center['memory_mb']:.1f}MB", Colors.CYAN)
-            if certified:
-                # Generate sovereign hash-based identifier for replacement function
-                from identity import sovereign_hash_id
-                traits = {'replacement_type': trig['name'], 'vp_values': vp_values, 'func_path': trig['func_path']}
-                new_sovereign_id = f"hash-{sovereign_hash_id(traits)}"
-                color_print(f"[Improvement] Certified new function: {new_sovereign_id}", Colors.GREEN)
-                added = self.kernel.amend(new_sovereign_id)
-                if added:
-                    color_print(f"[Kernel] Added new sovereign ID: {new_sovereign_id}", Colors.GREEN)
-                else:
-                    color_print(f"[Kernel] Sovereign ID already exists: {new_sovereign_id}", Colors.YELLOW)
-                self.diagnostics.save_checkpoint('certification', self.get_state())
-            self.diagnostics.maybe_time_checkpoint('time', self.get_state())
+            self.diagnostics.maybe_time_checkpoint('time', self.get_state)
         # Generate dynamic operations based on current state and insights
         operations = self.dynamic_operations.generate_operations(current_state, insight_data, forecast_data)
         
@@ -366,19 +395,13 @@ class BiphasicController:
                 continue
                 
             # Breathe between operations
-            self.breath_engine.breathe()
+            self._breathe()
             
             # Convert dynamic operation traits to match stability center format
-            converted_traits = {}
-            for key, value in op['traits'].items():
-                if key == 'execution_time_ms':
-                    converted_traits['speed_ms'] = value
-                elif key == 'memory_kb':
-                    converted_traits['memory_mb'] = value / 1024  # Convert KB to MB
-                elif key == 'terminated':
-                    converted_traits['reliability'] = value
-                else:
-                    converted_traits[key] = value
+            converted_traits = {
+                _TRAIT_RENAME.get(key, key): value * _TRAIT_SCALE[key] if key in _TRAIT_SCALE else value
+                for key, value in op['traits'].items()
+            }
             
             violation, vp = self.sentinel.monitor_kernel(
                 operation_traits=converted_traits,
@@ -389,85 +412,87 @@ class BiphasicController:
             # Record operation result for learning
             success = not violation
             self.dynamic_operations.record_operation_result(op['sovereign_id'], success, vp)
+            self._invalidate_state()
             
             if violation:
                 color_print(f"[Dynamic] Operation {op['sovereign_id']} VP: {vp:.3f}, Violation: {violation}", Colors.RED)
                 self.sentinel.handle_violation(op['sovereign_id'])
+                self._invalidate_state()
                 self.diagnostics.save_checkpoint('violation', self.get_state())
                 
                 # Generate replacement operation
                 color_print(f"[Dynamic] 🜂 Generating intelligent replacement for {op['sovereign_id']}...", Colors.YELLOW)
-                replacement_operations = self.dynamic_operations.generate_operations(current_state, insight_data, forecast_data)
-                
-                if replacement_operations:
-                    replacement_op = replacement_operations[0]
-                    certified, vp_values = self.sentinel.run_genesis_experiment(
-                        func_path='test_func1.py',
-                        test_inputs=[1, 2, 3],
-                        stability_center=self.stability_center,
-                        stability_envelope=self.stability_envelope
+                certified, vp_values = self.sentinel.run_genesis_experiment(
+                    func_path='test_func1.py',
+                    test_inputs=[1, 2, 3],
+                    stability_center=self.stability_center,
+                    stability_envelope=self.stability_envelope
+                )
+                if certified:
+                    self._register_certified(
+                        {'dynamic_replacement': True, 'original_op': op['sovereign_id'], 'vp_values': vp_values},
+                        announce="[Dynamic] 🜂 Certified intelligent replacement"
                     )
-                    if certified:
-                        # Generate sovereign hash-based identifier for dynamic replacement
-                        from identity import sovereign_hash_id
-                        traits = {'dynamic_replacement': True, 'original_op': op['sovereign_id'], 'vp_values': vp_values}
-                        new_sovereign_id = f"hash-{sovereign_hash_id(traits)}"
-                        color_print(f"[Dynamic] 🜂 Certified intelligent replacement: {new_sovereign_id}", Colors.GREEN)
-                        added = self.kernel.amend(new_sovereign_id)
-                        if added:
-                            color_print(f"[Kernel] Added new sovereign ID: {new_sovereign_id}", Colors.GREEN)
-                        else:
-                            color_print(f"[Kernel] Sovereign ID already exists: {new_sovereign_id}", Colors.YELLOW)
-                        self.diagnostics.save_checkpoint('certification', self.get_state())
             else:
                 color_print(f"[Dynamic] Operation {op['sovereign_id']} VP: {vp:.3f}, Success", Colors.GREEN)
                 
-            self.diagnostics.maybe_time_checkpoint('time', self.get_state())
+            self.diagnostics.maybe_time_checkpoint('time', self.get_state)
 
     def run(self):
+        try:
+            self._run_phases()
+        finally:
+            # Write buffered telemetry before any traceback, so it explains the crash
+            flush_log()
+            self.diagnostics.flush()
+
+    def _run_phases(self):
         # Genesis Phase loop
-        while self.phase == 'genesis':
-            if self.run_genesis_phase():
+        while self.phase == 'genesis' and not self.stop_requested:
+            transitioned = self.run_genesis_phase()
+            flush_log()
+            if transitioned:
                 # The Great Inauguration
-                print("[Controller] Rebooting into Sovereign Phase...")
+                log_print("[Controller] Rebooting into Sovereign Phase...")
                 self.phase = 'sovereign'
+                self._invalidate_state()
                 # Reconfigure Sentinel for Sovereign Phase (if needed)
                 # In this implementation, Sentinel handles both modes
         # Sovereign Phase loop
-        while self.phase == 'sovereign':
+        while self.phase == 'sovereign' and not self.stop_requested:
             self.run_sovereign_phase()
-            # Bloom-driven timing with breath integration
-            breath_pulse = self.breath_engine.get_breath_pulse()
-            bloom_pulse = self.bloom_system.get_bloom_pulse()
-            combined_pulse = (breath_pulse + bloom_pulse) / 2.0
-            
-            # Get current state for bloom assessment
-            current_state = self.get_state()
-            
-            # Adjust timing based on bloom maturity and resonance
-            base_sleep = 10.0
-            if self.bloom_system.should_trigger_bloom_event():
-                base_sleep = 5.0  # Faster cycles during bloom events
-            elif current_state['bloom_data']['bloom_maturity'] == 'mature':
-                base_sleep = 7.0  # Moderate speed for mature systems
-                
-            sleep_time = max(1.0, base_sleep / combined_pulse)
-            time.sleep(sleep_time)
+            flush_log()
+            # Bloom-driven timing with breath integration; pulses are read as the cycle ends,
+            # after the trigger and operation loops have breathed
+            sleep_time = self.bloom_system.recommend_sleep(
+                self.breath_engine.get_breath_pulse(),
+                self.bloom_system.get_bloom_pulse(),
+                bloom_event=self._bloom_event_active
+            )
+            # Sleep in short slices against a monotonic deadline so signals are handled promptly
+            deadline = time.monotonic() + sleep_time
+            remaining = sleep_time
+            while remaining > 0 and not self.stop_requested:
+                time.sleep(min(0.5, remaining))
+                remaining = deadline - time.monotonic()
 
 if __name__ == "__main__":
     import signal
-    import sys
 
     controller = BiphasicController()
-    def graceful_exit(signum, frame):
+    def request_shutdown(signum, frame):
+        # Only set a flag: checkpointing from the handler could deadlock on a
+        # queue lock held by the interrupted main thread
+        controller.stop_requested = True
+
+    signal.signal(signal.SIGINT, request_shutdown)
+    signal.signal(signal.SIGTERM, request_shutdown)
+    controller.diagnostics.save_checkpoint('startup', controller.get_state())
+    controller.run()
+    if controller.stop_requested:
+        # The loops have returned, so the shutdown checkpoint is taken on the main thread
         print("\n[Controller] Received shutdown signal. Shutting down gracefully...")
         controller.diagnostics.save_checkpoint('shutdown', controller.get_state())
+        flush_log()
+        controller.diagnostics.flush()
         controller.diagnostics.report(controller.get_state())
-        sys.exit(0)
-
-    signal.signal(signal.SIGINT, graceful_exit)
-    controller.diagnostics.save_checkpoint('startup', controller.get_state())
-    try:
-        controller.run()
-    except KeyboardInterrupt:
-        graceful_exit(None, None)
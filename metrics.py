@@ -1,33 +1,116 @@
+from array import array
+from functools import lru_cache
+from console import math_print, MATH_OUTPUT, TRAIT_TRANSLATIONS
 
-def _overflow_ratio(x, ideal, lo, hi):
+class PerformanceRing:
+    """
+    Fixed-capacity struct-of-arrays ring buffer of measured traits.
+    One preallocated column per trait; nothing is allocated after construction.
+    """
+    CAPACITY = 128  # Power of two so the write index wraps with a mask
+    _MASK = CAPACITY - 1
+
+    def __init__(self):
+        self.speed_ms = array('d', [0.0]) * self.CAPACITY
+        self.memory_mb = array('d', [0.0]) * self.CAPACITY
+        self.reliability = array('d', [0.0]) * self.CAPACITY
+        self.head = 0  # Total measurements ever appended
+
+    def append(self, traits):
+        i = self.head & self._MASK
+        self.speed_ms[i] = traits['speed_ms']
+        self.memory_mb[i] = traits['memory_mb']
+        self.reliability[i] = traits.get('reliability', 1.0)
+        self.head += 1
+
+    def __len__(self):
+        return min(self.head, self.CAPACITY)
+
+    def at_age(self, column, age):
+        """Return the value of column appended age appends ago (1 = newest, at most CAPACITY)"""
+        return column[(self.head - age) & self._MASK]
+
+def _scaled_overflow(x, ideal, lo, hi, inv):
     """
     Calculate violation ratio based on distance from ideal value.
     Penalizes deviation from ideal, with extra penalty for going outside envelope.
+    inv is the envelope's precomputed 1 / (hi - lo), or None when lo == hi.
     """
     # Handle case where lo == hi (exact value required)
-    if abs(hi - lo) < 1e-10:  # Essentially zero
-        if abs(x - ideal) < 1e-10:  # Essentially at ideal
-            return 0.0
-        else:
-            return 1.0  # Maximum penalty for any deviation
+    if inv is None:
+        return 0.0 if abs(x - ideal) < 1e-10 else 1.0  # Maximum penalty for any deviation
     
-    # Calculate distance from ideal
-    distance_from_ideal = abs(x - ideal)
-    
-    # Base penalty for deviation from ideal
-    base_penalty = distance_from_ideal / (hi - lo)
-    
-    # Extra penalty for going outside envelope
-    if x < lo:
-        extra_penalty = (lo - x) / (hi - lo)
-        return base_penalty + extra_penalty
-    elif x > hi:
-        extra_penalty = (x - hi) / (hi - lo)
-        return base_penalty + extra_penalty
-    else:
-        return base_penalty  # Just deviation from ideal
+    # Deviation from ideal plus overflow below lo or above hi (at most one is non-zero)
+    return (abs(x - ideal) + max(0.0, lo - x) + max(0.0, x - hi)) * inv
+
+@lru_cache(maxsize=32)
+def _envelope_recips(bounds):
+    """1 / (hi - lo) per (lo, hi) pair, or None where the envelope is essentially zero-width"""
+    return tuple(None if abs(hi - lo) < 1e-10 else 1.0 / (hi - lo) for lo, hi in bounds)
+
+def _vp_core(actuals, ideals, los, his, invs, weights):
+    """Weighted sum of overflow ratios over parallel per-trait sequences"""
+    vp = 0.0
+    for x, ideal, lo, hi, inv, w in zip(actuals, ideals, los, his, invs, weights):
+        vp += _scaled_overflow(x, ideal, lo, hi, inv) * w
+    return vp
 
-def calculate_vp(actual_traits: dict, stability_center: dict, stability_envelope: dict, weights=None) -> float:
+def _build_vp_plan(envelope_items, center_items, weight_items):
+    """
+    Unpack one (envelope, center, weights) configuration into parallel tuples:
+    (traits, ideals, los, his, reciprocal spans, weights, (label, desc) per trait).
+    """
+    center = dict(center_items)
+    weights = dict(weight_items) if weight_items else {}
+    traits = tuple(trait for trait, _ in envelope_items)
+    bounds = tuple((lo, hi) for _, (lo, hi) in envelope_items)
+    return (
+        traits,
+        tuple(center.get(trait, 0.0) for trait in traits),
+        tuple(lo for lo, _ in bounds),
+        tuple(hi for _, hi in bounds),
+        _envelope_recips(bounds),
+        tuple(weights.get(trait, 1.0) for trait in traits),
+        tuple(TRAIT_TRANSLATIONS.get(trait, (trait, 'No description.')) for trait in traits),
+    )
+
+_vp_plan = lru_cache(maxsize=8)(_build_vp_plan)
+
+def _resolve_vp_plan(stability_center, stability_envelope, weights):
+    """Look up (or build) the VP plan for one center/envelope/weights configuration"""
+    keys = (
+        tuple(stability_envelope.items()),
+        tuple(stability_center.items()),
+        tuple(weights.items()) if weights else None,
+    )
+    try:
+        return _vp_plan(*keys)
+    except TypeError:  # Unhashable bounds (e.g. lists from JSON); build uncached
+        return _build_vp_plan(*keys)
+
+def _vp_from_plan(plan, actual_traits, verbose):
+    traits, ideals, los, his, invs, w, labels = plan
+    actuals = [actual_traits.get(trait) for trait in traits]
+    if None in actuals:
+        # Traits that were not measured contribute nothing
+        present = [a is not None for a in actuals]
+        traits, actuals, ideals, los, his, invs, w, labels = (
+            [v for v, keep in zip(column, present) if keep]
+            for column in (traits, actuals, ideals, los, his, invs, w, labels)
+        )
+    vp = _vp_core(actuals, ideals, los, his, invs, w)
+    if verbose:
+        details = []
+        for actual, ideal, lo, hi, inv, wt, (label, desc) in zip(actuals, ideals, los, his, invs, w, labels):
+            part = _scaled_overflow(actual, ideal, lo, hi, inv) * wt
+            details.append(f"  |{label}: overflow({actual}, {lo}, {hi}) = {part} — {desc}")
+        # One telemetry line for the whole breakdown
+        math_print("\n".join(
+            ["[VP Calculation] VP = sum of:"] + details + [f"[VP Calculation] Total VP = {vp}"]
+        ))
+    return vp
+
+def calculate_vp(actual_traits: dict, stability_center: dict, stability_envelope: dict, weights=None, verbose=None) -> float:
     """
     Calculate Violation Potential (VP) for an entity.
     Only penalizes overflow outside the envelope.
@@ -36,28 +119,23 @@ def calculate_vp(actual_traits: dict, stability_center: dict, stability_envelope
         stability_center: dict of ideal trait values
         stability_envelope: dict like {'speed': (0, 100), 'memory_mb': (0, 256), 'reliability': (1, 1)}
         weights: optional per-dimension weights, defaults to 1.0 each
+        verbose: print the per-trait breakdown; False skips all string formatting.
+                 Defaults to on unless EXPLORER_QUIET is set
     Returns:
         Floating-point VP value.
     """
-    from main import math_print, TRAIT_TRANSLATIONS
-    weights = weights or {k: 1.0 for k in stability_envelope}
-    vp = 0.0
-    details = []
-    for trait in stability_envelope:
-        actual = actual_traits.get(trait, None)
-        if actual is None:
-            continue
-        ideal = stability_center.get(trait, 0.0)
-        lo, hi = stability_envelope[trait]
-        part = _overflow_ratio(actual, ideal, lo, hi) * weights.get(trait, 1.0)
-        label, desc = TRAIT_TRANSLATIONS.get(trait, (trait, 'No description.'))
-        details.append(f"|{label}: overflow({actual}, {lo}, {hi}) = {part} — {desc}")
-        vp += part
-    math_print("[VP Calculation] VP = sum of:")
-    for d in details:
-        math_print(f"  {d}")
-    math_print(f"[VP Calculation] Total VP = {vp}")
-    return vp
+    # The per-configuration plan is cached; only the actuals are gathered per call
+    plan = _resolve_vp_plan(stability_center, stability_envelope, weights)
+    return _vp_from_plan(plan, actual_traits, MATH_OUTPUT if verbose is None else verbose)
+
+def calculate_vp_batch(traits_rows, stability_center: dict, stability_envelope: dict, weights=None, verbose=None) -> list:
+    """
+    Calculate VP for several measurements against the same center and envelope.
+    The plan is resolved once for the whole batch. Returns one VP per row, in order.
+    """
+    plan = _resolve_vp_plan(stability_center, stability_envelope, weights)
+    verbose = MATH_OUTPUT if verbose is None else verbose
+    return [_vp_from_plan(plan, traits, verbose) for traits in traits_rows]
 
 # Example usage:
 if __name__ == "__main__":
@@ -4,27 +4,48 @@ Self-reflection and foresight capabilities
 """
 
 import time
-import math
+from collections import deque
+from dataclasses import dataclass
+from math import log
 from datetime import datetime
 
+# Entries kept per history; older ones are discarded as new ones arrive
+HISTORY_LIMIT = 1024
+
+# Phases in which the system counts as stable
+_STABLE_PHASES = frozenset(('genesis', 'sovereign'))
+
+# Shared read-only default for missing nested state dicts
+_EMPTY = {}
+
 class MirrorOfInsight:
     """Analyzes current system state and patterns"""
     
     def __init__(self):
-        self.insight_history = []
+        self.insight_history = deque(maxlen=HISTORY_LIMIT)
         self.pattern_memory = {}
-        self.stability_history = []  # Track stability calculations
+        self.stability_history = deque(maxlen=HISTORY_LIMIT)  # Track stability calculations
+        # Running moments of stability scores (Welford), so variance is O(1)
+        self._stability_count = 0
+        self._stability_mean = 0.0
+        self._stability_m2 = 0.0
         
     def reflect(self, system_state):
         """Analyze current system state and extract insights"""
+        # Destructure the state once; the helpers work on plain values
+        phase = system_state.get('phase', 'unknown')
+        breath_state = system_state.get('breath_state') or {}
+        sovereign_ids = system_state.get('kernel_sovereign_ids') or []
+        cycle_count = breath_state.get('cycle_count', 0)
+        function_count = len(sovereign_ids)
         insights = {
             'timestamp': time.time(),
-            'phase': system_state.get('phase', 'unknown'),
-            'breath_state': system_state.get('breath_state', {}),
-            'kernel_sovereign_ids': system_state.get('kernel_sovereign_ids', []),
-            'patterns': self._analyze_patterns(system_state),
-            'stability_assessment': self._assess_stability(system_state),
-            'growth_indicators': self._assess_growth(system_state)
+            'phase': phase,
+            'breath_state': breath_state,
+            'kernel_sovereign_ids': sovereign_ids,
+            'patterns': self._analyze_patterns(cycle_count, function_count, phase),
+            'stability_assessment': self._assess_stability(cycle_count, function_count, phase),
+            'growth_indicators': self._assess_growth(cycle_count, function_count, phase)
         }
         
         self.insight_history.append(insights)
@@ -36,46 +57,40 @@ class MirrorOfInsight:
             'timestamp': insights['timestamp'],
             'level': insights['stability_assessment']['level']
         })
+        self._stability_count += 1
+        delta = stability_score - self._stability_mean
+        self._stability_mean += delta / self._stability_count
+        self._stability_m2 += delta * (stability_score - self._stability_mean)
         
         return insights
     
-    def _analyze_patterns(self, state):
+    def _analyze_patterns(self, cycle_count, function_count, phase):
         """Analyze patterns in system behavior"""
         patterns = {
-            'breath_rhythm': 'stable' if state.get('breath_state', {}).get('cycle_count', 0) > 0 else 'forming',
-            'function_growth': len(state.get('kernel_sovereign_ids', [])),
-            'phase_consistency': 'consistent' if state.get('phase') in ['genesis', 'sovereign'] else 'unstable'
+            'breath_rhythm': 'stable' if cycle_count > 0 else 'forming',
+            'function_growth': function_count,
+            'phase_consistency': 'consistent' if phase in _STABLE_PHASES else 'unstable'
         }
         return patterns
     
-    def _assess_stability(self, state):
+    def _assess_stability(self, cycle_count, function_count, phase):
         """Assess system stability"""
-        breath_state = state.get('breath_state', {})
-        stability_score = 0.0
+        # Breath, function and phase stability, each weighted by its predicate
+        stability_score = (0.4 * (cycle_count > 5)
+                           + 0.3 * (function_count > 0)
+                           + 0.3 * (phase in _STABLE_PHASES))
         
-        # Breath stability
-        if breath_state.get('cycle_count', 0) > 5:
-            stability_score += 0.4
-            
-        # Function stability
-        if len(state.get('kernel_sovereign_ids', [])) > 0:
-            stability_score += 0.3
-            
-        # Phase stability
-        if state.get('phase') in ['genesis', 'sovereign']:
-            stability_score += 0.3
-            
         return {
             'score': stability_score,
             'level': 'stable' if stability_score > 0.7 else 'forming' if stability_score > 0.3 else 'unstable'
         }
     
-    def _assess_growth(self, state):
+    def _assess_growth(self, cycle_count, function_count, phase):
         """Assess system growth indicators"""
         growth = {
-            'function_count': len(state.get('kernel_sovereign_ids', [])),
-            'breath_cycles': state.get('breath_state', {}).get('cycle_count', 0),
-            'phase_progression': 'advancing' if state.get('phase') == 'sovereign' else 'developing'
+            'function_count': function_count,
+            'breath_cycles': cycle_count,
+            'phase_progression': 'advancing' if phase == 'sovereign' else 'developing'
         }
         return growth
     
@@ -87,18 +102,15 @@ class MirrorOfInsight:
     
     def get_stability_variance(self):
         """Calculate stability variance for mathematical understanding"""
-        if len(self.stability_history) < 2:
+        if self._stability_count < 2:
             return float('inf')
-        scores = [entry['score'] for entry in self.stability_history]
-        mean = sum(scores) / len(scores)
-        variance = sum((x - mean) ** 2 for x in scores) / len(scores)
-        return variance
+        return self._stability_m2 / self._stability_count
 
 class MirrorOfPortent:
     """Forecasts potential outcomes and warns of future consequences"""
     
     def __init__(self):
-        self.forecast_history = []
+        self.forecast_history = deque(maxlen=HISTORY_LIMIT)
         self.warning_thresholds = {
             'stability_drop': 0.3,
             'function_loss': 0.5,
@@ -144,45 +156,54 @@ class MirrorOfPortent:
     
     def _generate_warnings(self, state, insight):
         """Generate warnings about potential issues"""
-        warnings = []
-        stability = insight.get('stability_assessment', {})
-        
-        if stability.get('score', 0) < self.warning_thresholds['stability_drop']:
-            warnings.append({
-                'type': 'stability_warning',
-                'severity': 'high',
-                'message': 'System stability below threshold - intervention may be needed'
-            })
-            
-        if len(state.get('kernel_sovereign_ids', [])) == 0:
-            warnings.append({
-                'type': 'function_warning',
-                'severity': 'medium',
-                'message': 'No certified functions - system may be in critical state'
-            })
-            
-        return warnings
+        return [
+            {'type': kind, 'severity': severity, 'message': message}
+            for applies, kind, severity, message in _WARNING_RULES
+            if applies(self, state, insight)
+        ]
     
     def _identify_opportunities(self, state, insight):
         """Identify growth and improvement opportunities"""
-        opportunities = []
-        growth = insight.get('growth_indicators', {})
-        
-        if growth.get('function_count', 0) == 0:
-            opportunities.append({
-                'type': 'function_certification',
-                'priority': 'high',
-                'description': 'Opportunity to certify first functions'
-            })
-            
-        if insight.get('stability_assessment', {}).get('score', 0) > 0.6:
-            opportunities.append({
-                'type': 'phase_advancement',
-                'priority': 'medium',
-                'description': 'System ready for phase transition'
-            })
-            
-        return opportunities
+        return [
+            {'type': kind, 'priority': priority, 'description': description}
+            for applies, kind, priority, description in _OPPORTUNITY_RULES
+            if applies(self, state, insight)
+        ]
+
+# Forecast rules: (predicate(portent, state, insight), type, severity/priority, text)
+_WARNING_RULES = (
+    (lambda portent, state, insight:
+        insight.get('stability_assessment', _EMPTY).get('score', 0) < portent.warning_thresholds['stability_drop'],
+     'stability_warning', 'high', 'System stability below threshold - intervention may be needed'),
+    (lambda portent, state, insight:
+        len(state.get('kernel_sovereign_ids', ())) == 0,
+     'function_warning', 'medium', 'No certified functions - system may be in critical state'),
+)
+_OPPORTUNITY_RULES = (
+    (lambda portent, state, insight:
+        insight.get('growth_indicators', _EMPTY).get('function_count', 0) == 0,
+     'function_certification', 'high', 'Opportunity to certify first functions'),
+    (lambda portent, state, insight:
+        insight.get('stability_assessment', _EMPTY).get('score', 0) > 0.6,
+     'phase_advancement', 'medium', 'System ready for phase transition'),
+)
+
+# Bloom cycle count at which each maturity stage begins
+_MATURITY_STAGES = {5: 'growing', 15: 'flowering', 30: 'mature'}
+
+@dataclass
+class BloomMetrics:
+    """One bloom cycle's metrics, shared by the bloom history and the caller"""
+    # Declared by hand (not slots=True) so Python 3.8 still gets slotted instances
+    __slots__ = ('bloom_curvature', 'phase_bloom', 'reflection_index',
+                 'breath_resonance', 'natural_unfolding', 'bloom_cycles', 'bloom_maturity')
+    bloom_curvature: float
+    phase_bloom: float
+    reflection_index: float
+    breath_resonance: float
+    natural_unfolding: str
+    bloom_cycles: int
+    bloom_maturity: str
 
 class BloomSystem:
     """Natural unfolding and growth patterns"""
@@ -191,9 +212,12 @@ class BloomSystem:
         self.bloom_curvature = 0.0
         self.phase_bloom = 0.0
         self.reflection_index = 0.0
-        self.bloom_history = []
+        self.bloom_history = deque(maxlen=HISTORY_LIMIT)
         self.bloom_cycles = 0
         self.last_bloom_resonance = 0.0
+        # Memoized assessments; refreshed only by calculate_bloom_metrics
+        self._maturity = 'seedling'
+        self._bloom_event_ready = False
         
     def calculate_bloom_metrics(self, insight_data, forecast_data, breath_state=None):
         """Calculate bloom system metrics with breath integration"""
@@ -205,8 +229,7 @@ class BloomSystem:
         function_count = growth.get('function_count', 0)
         if function_count > 0:
             # Use log scale: log(1 + function_count) to prevent explosion
-            import math
-            log_function_count = math.log(1 + function_count)
+            log_function_count = log(1 + function_count)
             self.bloom_curvature = stability * log_function_count * 0.1
         else:
             self.bloom_curvature = 0.0
@@ -237,38 +260,28 @@ class BloomSystem:
         elif self.bloom_curvature > 0.2 or breath_resonance > 0.4:
             natural_unfolding = 'medium'
             
-        # Update bloom history
-        bloom_data = {
-            'timestamp': time.time(),
-            'bloom_curvature': self.bloom_curvature,
-            'phase_bloom': self.phase_bloom,
-            'reflection_index': self.reflection_index,
-            'breath_resonance': breath_resonance,
-            'natural_unfolding': natural_unfolding
-        }
-        self.bloom_history.append(bloom_data)
         self.bloom_cycles += 1
+        # Maturity only changes when the cycle count reaches a stage boundary
+        self._maturity = _MATURITY_STAGES.get(self.bloom_cycles, self._maturity)
+        self._bloom_event_ready = (self.bloom_curvature > 0.6) & (self.phase_bloom > 0.7) & (self.reflection_index > 0.5)
         
-        return {
-            'bloom_curvature': self.bloom_curvature,
-            'phase_bloom': self.phase_bloom,
-            'reflection_index': self.reflection_index,
-            'breath_resonance': breath_resonance,
-            'natural_unfolding': natural_unfolding,
-            'bloom_cycles': self.bloom_cycles,
-            'bloom_maturity': self._assess_bloom_maturity()
-        }
+        # The same record goes into the bloom history and back to the caller
+        metrics = BloomMetrics(
+            self.bloom_curvature,
+            self.phase_bloom,
+            self.reflection_index,
+            breath_resonance,
+            natural_unfolding,
+            self.bloom_cycles,
+            self._assess_bloom_maturity()
+        )
+        # The timestamp stays with the history entry, outside the returned (and checkpointed) record
+        self.bloom_history.append((time.time(), metrics))
+        return metrics
         
     def _assess_bloom_maturity(self):
         """Assess the maturity of the bloom system"""
-        if self.bloom_cycles < 5:
-            return 'seedling'
-        elif self.bloom_cycles < 15:
-            return 'growing'
-        elif self.bloom_cycles < 30:
-            return 'flowering'
-        else:
-            return 'mature'
+        return self._maturity
             
     def get_bloom_pulse(self):
         """Get the current bloom pulse for timing adjustments"""
@@ -276,6 +289,17 @@ class BloomSystem:
         
     def should_trigger_bloom_event(self):
         """Determine if a bloom event should be triggered"""
-        return (self.bloom_curvature > 0.6 and 
-                self.phase_bloom > 0.7 and 
-                self.reflection_index > 0.5)
+        return self._bloom_event_ready
+
+    def recommend_sleep(self, breath_pulse, bloom_pulse, bloom_event=None):
+        """
+        Seconds to rest between sovereign cycles: faster during bloom events,
+        moderate once mature, scaled by the mean of the breath and bloom pulses.
+        """
+        if bloom_event is None:
+            bloom_event = self.should_trigger_bloom_event()
+        base = 5.0 if bloom_event else 7.0 if self._assess_bloom_maturity() == 'mature' else 10.0
+        total_pulse = breath_pulse + bloom_pulse
+        if total_pulse <= 0.0:
+            return base  # No pulse yet; avoid dividing by zero
+        return max(1.0, base * 2.0 / total_pulse)
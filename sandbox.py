@@ -1,14 +1,22 @@
 import os
 import sys
 import tempfile
-import threading
 import time
-import psutil
 import win32job
+import win32file
+import win32api
 import win32process
 import win32con
 import subprocess
 
+# Job notifications that mean a resource quota was hit
+_LIMIT_MESSAGES = frozenset((
+    win32job.JOB_OBJECT_MSG_END_OF_JOB_TIME,
+    win32job.JOB_OBJECT_MSG_END_OF_PROCESS_TIME,
+    win32job.JOB_OBJECT_MSG_PROCESS_MEMORY_LIMIT,
+    win32job.JOB_OBJECT_MSG_JOB_MEMORY_LIMIT,
+))
+
 class IsolatedChamber:
     def __init__(self, timeout_sec=2, mem_limit_mb=64, cpu_time_sec=2):
         self.timeout_sec = timeout_sec
@@ -17,13 +25,20 @@ class IsolatedChamber:
         self.chamber_dir = tempfile.mkdtemp(prefix="chamber_")
 
     def _run_in_job(self, command):
-        # Create a job object for resource limits
-        job = win32job.CreateJobObject(None, "ChamberJob")
+        # Create a job object for resource limits; unnamed so each run gets its own
+        # job (a completion port can only be associated with a job once)
+        job = win32job.CreateJobObject(None, None)
         limits = win32job.QueryInformationJobObject(job, win32job.JobObjectExtendedLimitInformation)
         limits['ProcessMemoryLimit'] = self.mem_limit_mb * 1024 * 1024
         limits['BasicLimitInformation']['PerProcessUserTimeLimit'] = self.cpu_time_sec * 10000000  # 100ns units
         limits['BasicLimitInformation']['LimitFlags'] |= win32job.JOB_OBJECT_LIMIT_PROCESS_MEMORY | win32job.JOB_OBJECT_LIMIT_PROCESS_TIME
         win32job.SetInformationJobObject(job, win32job.JobObjectExtendedLimitInformation, limits)
+        # The job reports quota violations to a completion port, so nothing has to poll
+        port = win32file.CreateIoCompletionPort(win32file.INVALID_HANDLE_VALUE, None, 0, 1)
+        win32job.SetInformationJobObject(
+            job, win32job.JobObjectAssociateCompletionPortInformation,
+            {'CompletionKey': 1, 'CompletionPort': port}
+        )
 
         # Start the process in the chamber directory
         proc = subprocess.Popen(
@@ -34,49 +49,53 @@ class IsolatedChamber:
             shell=True
         )
         win32job.AssignProcessToJobObject(job, proc._handle)
-        return proc, job
+        return proc, job, port
+
+    def _limit_hit(self, port):
+        """Drain the job's queued notifications; True if any was a quota violation"""
+        hit = False
+        while True:
+            rc, message, _, _ = win32file.GetQueuedCompletionStatus(port, 0)
+            if rc != 0:  # WAIT_TIMEOUT: queue is empty
+                return hit
+            hit = hit or message in _LIMIT_MESSAGES
 
     def run(self, command):
         """
         Run an untrusted command in the isolated chamber with enforced timeouts and resource quotas.
         Returns (stdout, stderr, timed_out, resource_exceeded)
         """
-        proc, job = self._run_in_job(command)
+        proc, job, port = self._run_in_job(command)
         timed_out = False
-        resource_exceeded = False
-        output = {'stdout': b'', 'stderr': b''}
-        def target():
-            try:
-                out, err = proc.communicate(timeout=self.timeout_sec)
-                output['stdout'], output['stderr'] = out, err
-            except subprocess.TimeoutExpired:
-                nonlocal timed_out
-                timed_out = True
-                proc.kill()
-        thread = threading.Thread(target=target)
-        thread.start()
-        thread.join(self.timeout_sec + 1)
-        if thread.is_alive():
+        try:
+            stdout, stderr = proc.communicate(timeout=self.timeout_sec)
+        except subprocess.TimeoutExpired:
             timed_out = True
-            proc.kill()
-            thread.join()
-        # Check resource usage
+            # Kill the whole job: with shell=True the real command is a child of the shell
+            win32job.TerminateJobObject(job, 1)
+            # Reap the process and collect whatever it wrote before the kill
+            stdout, stderr = proc.communicate()
+        # The job object enforced the quotas; read what it reported
         try:
-            p = psutil.Process(proc.pid)
-            mem = p.memory_info().rss
-            cpu = p.cpu_times().user
-            if mem > self.mem_limit_mb * 1024 * 1024 or cpu > self.cpu_time_sec:
-                resource_exceeded = True
-                proc.kill()
-        except Exception:
-            pass
-        stdout, stderr = output['stdout'], output['stderr']
+            resource_exceeded = self._limit_hit(port)
+        finally:
+            win32api.CloseHandle(port)
+            win32api.CloseHandle(job)
         return stdout, stderr, timed_out, resource_exceeded
 
+    def reset(self, artifacts=('input.txt',)):
+        """Remove the per-run files so the chamber can be reused; keeps the directory"""
+        for name in artifacts:
+            try:
+                os.remove(os.path.join(self.chamber_dir, name))
+            except FileNotFoundError:
+                pass
+
     def cleanup(self):
         try:
-            for f in os.listdir(self.chamber_dir):
-                os.remove(os.path.join(self.chamber_dir, f))
+            with os.scandir(self.chamber_dir) as entries:
+                for entry in entries:
+                    os.remove(entry.path)
             os.rmdir(self.chamber_dir)
         except Exception:
             pass
@@ -1,26 +1,54 @@
 import os
+import json
+import atexit
 import time
+import psutil
+from array import array
+from collections import deque
+from operator import mul
+from statistics import fmean
 from sandbox import IsolatedChamber
-from metrics import calculate_vp
+from metrics import calculate_vp, calculate_vp_batch
 from kernel import Kernel
+from mirror_systems import HISTORY_LIMIT
+from console import color_print, Colors, explain_traits, math_print, log_print
 
 class Sentinel:
-    def __init__(self, config_path='data/config.json'):
-        self.kernel = Kernel()
+    VP_RING_SIZE = 10  # VPs considered by the pattern-recognition check
+
+    def __init__(self, config_path='data/config.json', kernel=None):
+        # Share the controller's Kernel so both see the same journal and snapshots
+        self.kernel = kernel if kernel is not None else Kernel()
+        # One chamber is reused across experiments; its directory is removed at exit
+        self.chamber = IsolatedChamber()
+        atexit.register(self.chamber.cleanup)
         self.config = self._load_config(config_path)
         self.vp_threshold = self.config.get('vp_threshold', 1.0)
         self.critical_mass_sample_size = self.config.get('critical_mass_sample_size', 5)
-        self.vp_history = []  # Track all VP calculations
-        self.stability_history = []  # Track stability calculations
+        self.vp_history = deque(maxlen=HISTORY_LIMIT)  # Track recent VP calculations
+        # Ring of the most recent VP values for the pattern-recognition variance
+        self._vp_ring = array('d', [0.0]) * self.VP_RING_SIZE
+        self._vp_ring_count = 0
+        self.stability_history = deque(maxlen=HISTORY_LIMIT)  # Track stability calculations
+        # Optional subsystems for the capability assessment; see register_subsystems
+        self.mirror_of_insight = None
+        self.breath_engine = None
+        self.bloom_system = None
+        self.dynamic_operations = None
+
+    def register_subsystems(self, mirror=None, breath=None, bloom=None, dyn_ops=None):
+        """Connect the systems consulted by check_mathematical_capability"""
+        self.mirror_of_insight = mirror
+        self.breath_engine = breath
+        self.bloom_system = bloom
+        self.dynamic_operations = dyn_ops
 
     def _load_config(self, path):
-        import json
         with open(path, 'r') as f:
             return json.load(f)
 
     # --- Genesis Phase Logic ---
     def run_genesis_experiment(self, func_path, test_inputs, stability_center, stability_envelope):
-        from main import color_print, Colors, explain_traits, math_print
         color_print(f"[Sentinel] Genesis experiment: func_path={func_path}, inputs={test_inputs}", Colors.CYAN)
         color_print(f"[Info] Stability center and envelope:", Colors.GRAY)
         math_print(explain_traits(stability_center))
@@ -33,10 +61,9 @@ class Sentinel:
         stability_envelope: dict of allowed deviation for each trait
         Returns: (certified: bool, vp_values: list)
         """
-        chamber = IsolatedChamber()
-        vp_values = []
+        chamber = self.chamber
+        measured = []
         all_terminated = True
-        import psutil
         for inp in test_inputs:
             # Prepare input file for the experiment
             input_file = os.path.join(chamber.chamber_dir, 'input.txt')
@@ -49,7 +76,6 @@ class Sentinel:
                 exec_time = time.time() - start
                 
                 # Get the process that was actually run by the chamber
-                import psutil
                 current_process = psutil.Process()
                 mem_usage_mb = current_process.memory_info().rss / (1024 * 1024)
                 
@@ -62,7 +88,7 @@ class Sentinel:
                 mem_usage_mb = 0.0
                 resource_exceeded = False
                 timed_out = False
-                print(f"[Warning] Exception during execution: {e}")
+                log_print(f"[Warning] Exception during execution: {e}")
             finally:
                 # Chamber handles process cleanup
                 pass
@@ -75,20 +101,17 @@ class Sentinel:
             }
             color_print(f"[Info] Traits measured:", Colors.GRAY)
             math_print(explain_traits(traits))
-            vp = calculate_vp(traits, stability_center, stability_envelope)
-        vp_values.append(vp)
-        # Track VP calculation for mathematical understanding
-        self.vp_history.append({
-            'vp': vp,
-            'traits': traits,
-            'timestamp': time.time(),
-            'context': 'genesis_experiment'
-        })
-        if timed_out or resource_exceeded:
-            all_terminated = False
-        chamber.cleanup()
-        # Certification: must terminate and have low VP for all inputs
-        certified = all_terminated and all(vp < self.vp_threshold for vp in vp_values)
+            measured.append(traits)
+            if timed_out or resource_exceeded:
+                all_terminated = False
+        chamber.reset()
+        # Score every input against the same center and envelope in one batch
+        vp_values = calculate_vp_batch(measured, stability_center, stability_envelope)
+        for vp, traits in zip(vp_values, measured):
+            # Track VP calculation for mathematical understanding
+            self._record_vp(vp, traits, 'genesis_experiment')
+        # Certification: at least one measurement, and every input must terminate with low VP
+        certified = bool(vp_values) and all_terminated and all(vp < self.vp_threshold for vp in vp_values)
         math_print(f"[VP Calculation] VP values for all inputs: {vp_values}")
         if certified:
             color_print(f"[Result] Certified: {certified} (all_terminated={all_terminated}, threshold={self.vp_threshold}) ✅ This function is stable and lawful.", Colors.GREEN)
@@ -96,6 +119,17 @@ class Sentinel:
             color_print(f"[Result] Certified: {certified} (all_terminated={all_terminated}, threshold={self.vp_threshold}) ❌ This function is unstable or unlawful.", Colors.RED)
         return certified, vp_values
 
+    def _record_vp(self, vp, traits, context):
+        """Append a VP calculation to the history and the recent-VP ring"""
+        self.vp_history.append({
+            'vp': vp,
+            'traits': traits,
+            'timestamp': time.time(),
+            'context': context
+        })
+        self._vp_ring[self._vp_ring_count % self.VP_RING_SIZE] = vp
+        self._vp_ring_count += 1
+
     def check_critical_mass(self):
         """
         Check if the system has mathematical capability for understanding.
@@ -109,13 +143,12 @@ class Sentinel:
         Returns: bool
         """
         # 1. VP Calculation Mastery
-        vp_calculations = len(self.vp_history)
+        vp_calculations = self._vp_ring_count  # Every VP ever recorded, not just those retained
         understands_vp = vp_calculations >= 50
         
         # 2. VP Pattern Recognition
-        if len(self.vp_history) >= 10:
-            recent_vps = [entry['vp'] for entry in self.vp_history[-10:]]
-            vp_variance = self._calculate_variance(recent_vps)
+        if self._vp_ring_count >= self.VP_RING_SIZE:
+            vp_variance = self._calculate_variance(self._vp_ring)
             vp_stability = vp_variance < 0.1  # Low variance indicates understanding
         else:
             vp_stability = False
@@ -123,31 +156,35 @@ class Sentinel:
         # 3. Stability Mathematics (if mirror systems available)
         understands_stability = True  # Default if no mirror systems
         stability_variance = float('inf')
-        if hasattr(self, 'mirror_of_insight') and self.mirror_of_insight:
-            stability_score = self.mirror_of_insight.get_stability_score()
-            stability_variance = self.mirror_of_insight.get_stability_variance()
+        mirror = self.mirror_of_insight
+        if mirror is not None:
+            stability_score = mirror.get_stability_score()
+            stability_variance = mirror.get_stability_variance()
             understands_stability = stability_score > 0.5 and stability_variance < 0.2
         
         # 4. Breath Mathematics (if breath engine available)
         understands_breath = True  # Default if no breath engine
         breath_cycles = 0
-        if hasattr(self, 'breath_engine') and self.breath_engine:
-            breath_cycles = self.breath_engine.breath_cycle_count
+        breath = self.breath_engine
+        if breath is not None:
+            breath_cycles = breath.breath_cycle_count
             understands_breath = breath_cycles >= 25
         
         # 5. Bloom Mathematics (if bloom system available)
         understands_bloom = True  # Default if no bloom system
         bloom_curvature = 0.0
-        if hasattr(self, 'bloom_system') and self.bloom_system:
-            bloom_curvature = self.bloom_system.bloom_curvature
+        bloom = self.bloom_system
+        if bloom is not None:
+            bloom_curvature = bloom.bloom_curvature
             understands_bloom = bloom_curvature > 0.2
         
         # 6. Learning Mathematics (if dynamic operations available)
         understands_learning = True  # Default if no dynamic operations
-        if hasattr(self, 'dynamic_operations') and self.dynamic_operations:
-            total_patterns = len(self.dynamic_operations.success_patterns) + len(self.dynamic_operations.failure_patterns)
+        dyn_ops = self.dynamic_operations
+        if dyn_ops is not None:
+            total_patterns = len(dyn_ops.success_patterns) + len(dyn_ops.failure_patterns)
             if total_patterns > 0:
-                success_rate = len(self.dynamic_operations.success_patterns) / total_patterns
+                success_rate = len(dyn_ops.success_patterns) / total_patterns
                 understands_learning = success_rate > 0.6
         
         # 7. Overall Mathematical Maturity
@@ -156,7 +193,6 @@ class Sentinel:
                                understands_bloom and understands_learning)
         
         # Log comprehensive mathematical capability assessment
-        from main import color_print, Colors
         color_print(f"[Mathematical Capability] VP: {vp_calculations}/50 (stable: {vp_stability})", Colors.CYAN)
         color_print(f"[Mathematical Capability] Stability: {understands_stability} (variance: {stability_variance:.3f})", Colors.CYAN)
         color_print(f"[Mathematical Capability] Breath: {understands_breath} (cycles: {breath_cycles})", Colors.CYAN)
@@ -170,13 +206,13 @@ class Sentinel:
         """Calculate variance of a list of values"""
         if len(values) < 2:
             return float('inf')
-        mean = sum(values) / len(values)
-        variance = sum((x - mean) ** 2 for x in values) / len(values)
-        return variance
+        # Population variance; fmean keeps both passes' summation in C
+        mean = fmean(values)
+        deviations = [x - mean for x in values]
+        return fmean(map(mul, deviations, deviations))
 
     # --- Sovereign Phase Logic ---
     def monitor_kernel(self, operation_traits, stability_center, stability_envelope):
-        from main import color_print, Colors, explain_traits, math_print
         color_print(f"[Sentinel] Monitoring kernel operation: traits={operation_traits}", Colors.CYAN)
         color_print(f"[Info] Stability center and envelope:", Colors.GRAY)
         math_print(explain_traits(stability_center))
@@ -191,12 +227,7 @@ class Sentinel:
         violation_detected = vp > self.vp_threshold
         
         # Track VP calculation for mathematical understanding
-        self.vp_history.append({
-            'vp': vp,
-            'traits': operation_traits,
-            'timestamp': time.time(),
-            'context': 'sovereign_monitoring'
-        })
+        self._record_vp(vp, operation_traits, 'sovereign_monitoring')
         if violation_detected:
             color_print(f"[Result] VP={vp}, Violation detected={violation_detected} (threshold={self.vp_threshold}) ❌ Unstable or unlawful operation.", Colors.RED)
         else:
@@ -207,13 +238,12 @@ class Sentinel:
         """
         Eject offending function sovereign ID and trigger kernel rollback.
         """
-        sovereign_ids = self.kernel.get_sovereign_ids()
-        if offending_sovereign_id in sovereign_ids:
-            sovereign_ids.remove(offending_sovereign_id)
+        # Only an ejected ID changes the kernel; rolling back otherwise would
+        # undo an unrelated certified amendment
+        if self.kernel.discard(offending_sovereign_id):
             # Amend kernel without offending sovereign ID
-            self.kernel.sovereign_ids = sovereign_ids
             self.kernel.amend('')  # Empty string to force new version
-        self.kernel.rollback()
+            self.kernel.rollback()
 
 # Example usage:
 if __name__ == "__main__":
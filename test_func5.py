@@ -4,19 +4,19 @@ def main():
     import time
     import threading
     import os
+    from math import isqrt
 
-    # Sample workload: compute primes up to N
+    # Sample workload: compute primes up to N (sieve of Eratosthenes)
     def compute_primes(n):
-        primes = []
-        for i in range(2, n):
-            is_prime = True
-            for j in range(2, int(i ** 0.5) + 1):
-                if i % j == 0:
-                    is_prime = False
-                    break
-            if is_prime:
-                primes.append(i)
-        return primes
+        if n < 3:
+            return []
+        sieve = bytearray([1]) * n
+        sieve[0] = sieve[1] = 0
+        for i in range(2, isqrt(n - 1) + 1):
+            if sieve[i]:
+                # Strike out multiples from i*i in one slice assignment
+                sieve[i * i::i] = bytes(len(range(i * i, n, i)))
+        return [i for i, is_prime in enumerate(sieve) if is_prime]
 
     # Measure traits
     start_time = time.time()
@@ -58,7 +58,7 @@ def main():
 
     args = [f'{k}={v}' for k, v in traits.items()]
     # Build command to run in new PowerShell window and keep it open
-    cmd = f'python math_art_display.py {' '.join(args)}; pause'
+    cmd = f"python math_art_display.py {' '.join(args)}; pause"
     powershell_cmd = [
         'powershell', '-NoExit', '-Command', cmd
     ]
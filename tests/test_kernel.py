@@ -0,0 +1,60 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import kernel
+from kernel import Kernel
+from sentinel import Sentinel
+
+class KernelViolationTest(unittest.TestCase):
+    def setUp(self):
+        self.kernel_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.kernel_dir, 'versions'))
+        self.kernel = Kernel(self.kernel_dir)
+        # handle_violation only needs the shared kernel, not a chamber or config
+        self.sentinel = Sentinel.__new__(Sentinel)
+        self.sentinel.kernel = self.kernel
+
+    def tearDown(self):
+        shutil.rmtree(self.kernel_dir, ignore_errors=True)
+
+    def test_unknown_offender_leaves_kernel_intact(self):
+        ids = [f'hash-{i}' for i in range(5)]
+        for sovereign_id in ids:
+            self.kernel.amend(sovereign_id)
+        for i in range(3):
+            self.sentinel.handle_violation(f'hash-dynamic-{i}')
+        self.assertEqual(self.kernel.get_sovereign_ids(), ids)
+        self.assertEqual(Kernel(self.kernel_dir).get_sovereign_ids(), ids)
+
+    def test_offender_is_ejected_and_stays_out(self):
+        old_interval = kernel.SNAPSHOT_INTERVAL
+        kernel.SNAPSHOT_INTERVAL = 3
+        try:
+            ids = [f'hash-{i}' for i in range(8)]
+            for sovereign_id in ids:
+                self.kernel.amend(sovereign_id)
+            self.sentinel.handle_violation('hash-3')
+        finally:
+            kernel.SNAPSHOT_INTERVAL = old_interval
+        expected = [i for i in ids if i != 'hash-3']
+        self.assertEqual(self.kernel.get_sovereign_ids(), expected)
+        self.assertEqual(Kernel(self.kernel_dir).get_sovereign_ids(), expected)
+
+    def test_rollback_undoes_one_amendment(self):
+        for i in range(4):
+            self.kernel.amend(f'hash-{i}')
+        self.kernel._write_snapshot()
+        self.kernel.amend('hash-4')
+        self.assertTrue(self.kernel.rollback())  # Journaled amendment
+        self.assertTrue(self.kernel.rollback())  # Empty journal: last snapshot entry
+        expected = ['hash-0', 'hash-1', 'hash-2']
+        self.assertEqual(self.kernel.get_sovereign_ids(), expected)
+        self.assertEqual(Kernel(self.kernel_dir).get_sovereign_ids(), expected)
+
+if __name__ == '__main__':
+    unittest.main()
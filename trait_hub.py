@@ -2,11 +2,15 @@
 trait_hub.py
 Flexible trait translation hub with plug-in mapping support.
 """
-import importlib
+import importlib.util
 import os
-import glob
+
+_DEFAULT_DESC = 'No description available.'
 
 class TraitHub:
+    # plugin_dir -> (plugin file signature, merged TRAIT_MAP); shared by all instances
+    _CACHE = {}
+
     def __init__(self, plugin_dir='trait_plugins'):
         self.mappings = {}
         self.load_plugins(plugin_dir)
@@ -15,25 +19,36 @@ class TraitHub:
         # Load all Python plugin files in the directory
         if not os.path.exists(plugin_dir):
             os.makedirs(plugin_dir)
-        for plugin_path in glob.glob(os.path.join(plugin_dir, '*.py')):
-            module_name = os.path.splitext(os.path.basename(plugin_path))[0]
-            spec = importlib.util.spec_from_file_location(module_name, plugin_path)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            if hasattr(module, 'TRAIT_MAP'):
-                self.mappings.update(module.TRAIT_MAP)
+        # DirEntry carries the path and cached stat info, so no extra stat per plugin
+        with os.scandir(plugin_dir) as entries:
+            plugins = sorted(
+                (entry.path, entry.stat().st_mtime) for entry in entries
+                if entry.name.endswith('.py') and not entry.name.startswith('.') and entry.is_file()
+            )
+        plugin_paths = [path for path, _ in plugins]
+        # Plugins are only re-executed when a file is added, removed or modified
+        signature = tuple(plugins)
+        key = os.path.abspath(plugin_dir)
+        cached = self._CACHE.get(key)
+        if cached is None or cached[0] != signature:
+            merged = {}
+            for plugin_path in plugin_paths:
+                module_name = os.path.splitext(os.path.basename(plugin_path))[0]
+                spec = importlib.util.spec_from_file_location(module_name, plugin_path)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                if hasattr(module, 'TRAIT_MAP'):
+                    merged.update(module.TRAIT_MAP)
+            cached = self._CACHE[key] = (signature, merged)
+        self.mappings.update(cached[1])
 
     def translate(self, traits: dict):
-        results = []
-        for k, v in traits.items():
-            label, desc = self.mappings.get(k, (k, 'No description available.'))
-            results.append({
-                'trait': k,
-                'label': label,
-                'description': desc,
-                'value': v
-            })
-        return results
+        m = self.mappings
+        # One mapping lookup per trait; unknown traits are labelled with their own name
+        return [
+            {'trait': k, 'label': (ld := m.get(k, (k, _DEFAULT_DESC)))[0], 'description': ld[1], 'value': v}
+            for k, v in traits.items()
+        ]
 
     def print_translation(self, traits: dict):
         translations = self.translate(traits)